@@ -505,18 +505,22 @@ async def analyze_parcel(
         )
 
         # Track API usage for free tier enforcement
+        from sqlalchemy import insert
         from app.models.subscription import APIUsage
         from app.core.database import get_session as get_db_session
 
+        # Core insert: the row is write-only here, so skip building an ORM
+        # instance and the unit-of-work flush
         with next(get_db_session()) as session:
-            usage = APIUsage(
-                user_id=current_user.id,
-                endpoint=request.url.path,
-                method="POST",
-                status_code=200,
-                parcel_apn=parcel.apn
+            session.execute(
+                insert(APIUsage).values(
+                    user_id=current_user.id,
+                    endpoint=request.url.path,
+                    method="POST",
+                    status_code=200,
+                    parcel_apn=parcel.apn
+                )
             )
-            session.add(usage)
             session.commit()
 
         return response
@@ -16,8 +16,8 @@ from app.models.user import (
 )
 from app.models.subscription import Subscription, SubscriptionStatus, SubscriptionPlan
 from app.core.security import (
-    verify_password,
-    get_password_hash,
+    averify_password,
+    aget_password_hash,
     create_access_token,
     create_refresh_token,
     verify_token,
@@ -67,7 +67,7 @@ async def register(
         )
 
     # Create user
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await aget_password_hash(user_data.password)
     db_user = User(
         email=user_data.email,
         full_name=user_data.full_name,
@@ -134,7 +134,7 @@ async def login(
         )
 
     # Verify password
-    if not verify_password(login_data.password, user.hashed_password):
+    if not await averify_password(login_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -325,7 +325,7 @@ async def update_current_user(
                 detail=error_message
             )
 
-        current_user.hashed_password = get_password_hash(user_update.password)
+        current_user.hashed_password = await aget_password_hash(user_update.password)
 
     # Update is_active if provided
     if user_update.is_active is not None:
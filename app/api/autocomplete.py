@@ -41,9 +41,15 @@ async def autocomplete_parcels(
     """
     try:
         with Session(engine) as session:
-            # Search by APN or address
+            # Search by APN or address, loading only the columns in the
+            # response (not the parcel geometry)
             statement = (
-                select(ParcelCache)
+                select(
+                    ParcelCache.apn,
+                    ParcelCache.address,
+                    ParcelCache.zoning_code,
+                    ParcelCache.lot_size_sqft,
+                )
                 .where(
                     or_(
                         ParcelCache.apn.ilike(f"{q}%"),
@@ -53,16 +59,17 @@ async def autocomplete_parcels(
                 .limit(limit)
             )
 
-            parcels = session.exec(statement).all()
+            rows = session.exec(statement).all()
 
+            # Plain dicts: response_model validates the whole list in one pass
             return [
-                AutocompleteResult(
-                    apn=p.apn,
-                    address=p.address or "",
-                    zoning_code=p.zoning_code,
-                    lot_size_sqft=p.lot_size_sqft
-                )
-                for p in parcels
+                {
+                    "apn": apn,
+                    "address": address or "",
+                    "zoning_code": zoning_code,
+                    "lot_size_sqft": lot_size_sqft,
+                }
+                for apn, address, zoning_code, lot_size_sqft in rows
             ]
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Autocomplete search failed: {str(e)}")
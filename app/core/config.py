@@ -101,10 +101,15 @@ class Settings(BaseSettings):
 
     # JWT Authentication
     JWT_SECRET_KEY: str = "CHANGE_ME_IN_PRODUCTION_USE_LONG_RANDOM_STRING"
-    JWT_ALGORITHM: str = "HS256"
+    JWT_ALGORITHM: str = "HS256"  # HS* uses JWT_SECRET_KEY; RS*/ES*/EdDSA use the key pair below
+    JWT_PRIVATE_KEY: Optional[str] = None  # PEM private key for signing (asymmetric algorithms)
+    JWT_PUBLIC_KEY: Optional[str] = None  # PEM public key for verification (asymmetric algorithms)
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
 
+    # Password hashing
+    BCRYPT_ROUNDS: int = 12  # bcrypt cost factor (2^rounds iterations); tune to hardware
+
     # ============================================
     # Payment Processing (Stripe)
     # ============================================
@@ -19,11 +19,15 @@ References:
 """
 
 import numpy as np
-from scipy import stats, optimize
-from typing import List, Dict, Any, Optional, Callable, Tuple
+from scipy import stats
+from typing import List, Dict, Any, Optional, Callable, Tuple, Sequence, Union
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from itertools import accumulate
 import logging
+import os
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +37,7 @@ logger = logging.getLogger(__name__)
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class CashFlow:
     """
     Represents a single period cash flow.
@@ -52,7 +56,7 @@ class CashFlow:
     phase: str
 
 
-@dataclass
+@dataclass(slots=True)
 class SensitivityInput:
     """
     Input for one-way sensitivity analysis.
@@ -69,7 +73,7 @@ class SensitivityInput:
     label: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TornadoResult:
     """
     Result from tornado sensitivity analysis.
@@ -94,7 +98,7 @@ class TornadoResult:
     upside_value: float
 
 
-@dataclass
+@dataclass(slots=True)
 class MonteCarloInputs:
     """
     Inputs for Monte Carlo simulation.
@@ -109,6 +113,12 @@ class MonteCarloInputs:
         cap_rate_max: Maximum exit cap rate (triangular distribution)
         construction_delay_mean: Mean construction delay in months (lognormal)
         construction_delay_std: Std dev of construction delay (lognormal)
+        workers: Number of worker processes used to evaluate NPVs (1 = serial,
+            None = one per CPU core). Samples are always drawn in the calling
+            process, so results are identical for any worker count.
+        retain_samples: Keep the per-iteration NPV array on the result. Set to
+            False when only summary statistics are needed so the samples are
+            released as soon as the statistics are computed.
     """
     iterations: int = 10000
     seed: int = 42
@@ -119,16 +129,18 @@ class MonteCarloInputs:
     cap_rate_max: float = 0.07
     construction_delay_mean: float = 0.0  # Mean delay in months
     construction_delay_std: float = 3.0  # Std dev in months
+    workers: Optional[int] = 1
+    retain_samples: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class MonteCarloResult:
     """
     Results from Monte Carlo simulation.
 
     Attributes:
         iterations: Number of iterations run
-        npv_array: Array of NPV results
+        npv_array: Array of NPV results (None when samples were not retained)
         probability_positive: Probability of NPV > 0
         mean_npv: Mean NPV
         median_npv: Median NPV (50th percentile)
@@ -141,7 +153,7 @@ class MonteCarloResult:
         histogram_counts: Histogram counts per bin
     """
     iterations: int
-    npv_array: np.ndarray
+    npv_array: Optional[np.ndarray]
     probability_positive: float
     mean_npv: float
     median_npv: float
@@ -154,7 +166,7 @@ class MonteCarloResult:
     histogram_counts: np.ndarray
 
 
-@dataclass
+@dataclass(slots=True)
 class TimelineInputs:
     """
     Development timeline inputs for cash flow generation.
@@ -176,8 +188,30 @@ class TimelineInputs:
 # ============================================================================
 
 
+@lru_cache(maxsize=256)
+def _discount_factors(discount_rate: float, num_periods: int) -> np.ndarray:
+    """
+    Return the inverse discount factors 1/(1+r)^t for t = 1..num_periods.
+
+    Cached per (rate, length) so repeated NPV evaluations (sensitivity and
+    Monte Carlo runs) reuse the same vector. The array is marked read-only
+    because it is shared between callers.
+
+    Args:
+        discount_rate: Annual discount rate (e.g., 0.12 for 12%)
+        num_periods: Number of periods (years) to discount
+
+    Returns:
+        Read-only array of length num_periods
+    """
+    periods = np.arange(1, num_periods + 1, dtype=np.float64)
+    factors = np.power(1.0 + discount_rate, -periods)
+    factors.flags.writeable = False
+    return factors
+
+
 def calculate_npv(
-    cash_flows: List[float],
+    cash_flows: Union[Sequence[float], np.ndarray],
     discount_rate: float,
     initial_investment: float
 ) -> float:
@@ -193,7 +227,8 @@ def calculate_npv(
         t = time period (years)
 
     Args:
-        cash_flows: Annual cash flows starting from Year 1
+        cash_flows: Annual cash flows starting from Year 1 (list or float64
+            ndarray; arrays are used as-is without copying)
         discount_rate: Annual discount rate (e.g., 0.12 for 12%)
         initial_investment: Initial capital outlay (positive number)
 
@@ -206,95 +241,238 @@ def calculate_npv(
         >>> calculate_npv([50, 50, 50], 0.10, 200)
         -75.6574074074074
     """
-    if not cash_flows:
-        return -initial_investment
+    # No-op when callers already pass a float64 array
+    cf_array = np.asarray(cash_flows, dtype=np.float64)
 
-    # Convert to numpy array for vectorized calculation
-    cf_array = np.array(cash_flows, dtype=float)
-    periods = np.arange(1, len(cf_array) + 1)
+    if cf_array.size == 0:
+        return -initial_investment
 
-    # Calculate present value of each cash flow
-    discount_factors = (1 + discount_rate) ** periods
-    present_values = cf_array / discount_factors
+    # Sum of PVs as a single dot product against the inverse discount factors
+    # (no intermediate present-value array)
+    discount_factors = _discount_factors(float(discount_rate), len(cf_array))
 
     # NPV = -Initial Investment + Sum of PVs
-    npv = -initial_investment + np.sum(present_values)
+    npv = -initial_investment + float(cf_array @ discount_factors)
 
-    return float(npv)
+    return npv
+
+
+# Rate an IRR solve is steered towards when several roots exist
+_IRR_DEFAULT_GUESS = 0.10
 
 
 def calculate_irr(
-    cash_flows: List[float],
+    cash_flows: Union[Sequence[float], np.ndarray],
     initial_investment: float,
     max_iterations: int = 100,
-    tolerance: float = 1e-6
+    tolerance: float = 1e-6,
+    guess: float = _IRR_DEFAULT_GUESS
 ) -> Optional[float]:
     """
-    Calculate Internal Rate of Return (IRR) using Newton-Raphson method.
+    Calculate Internal Rate of Return (IRR).
 
-    IRR is the discount rate where NPV = 0. Solved iteratively using:
+    IRR is the discount rate where NPV = 0. Solved with Newton-Raphson from a
+    starting rate bracketed next to a sign change of NPV:
         r_{n+1} = r_n - f(r_n) / f'(r_n)
 
     where:
         f(r) = NPV function
         f'(r) = derivative of NPV function
 
+    If Newton fails (zero derivative or no convergence), streams of up to 30
+    periods are solved again through x = 1/(1+r), which turns NPV into a
+    polynomial Σ CFt · x^t = 0 whose roots np.roots finds directly. That
+    eigenvalue solve is only a fallback because it is slower than Newton on
+    typical development streams.
+
+    When several IRRs exist (non-conventional cash flows), the one closest to
+    guess (10% by default) is returned.
+
     Args:
         cash_flows: Annual cash flows starting from Year 1
         initial_investment: Initial capital outlay (positive number)
-        max_iterations: Maximum iterations for convergence
-        tolerance: Convergence tolerance
+        max_iterations: Maximum Newton iterations for convergence
+        tolerance: Newton convergence tolerance
+        guess: Expected rate used to pick among multiple IRRs
 
     Returns:
         IRR as decimal (e.g., 0.185 for 18.5%) or None if no solution
 
     Examples:
         >>> calculate_irr([100, 100, 100], 200)
-        0.2311...
+        0.2337...
     """
-    if not cash_flows:
+    cf_array = np.asarray(cash_flows, dtype=np.float64)
+
+    if cf_array.size == 0:
         return None
 
     # Construct full cash flow array including initial investment
-    full_cf = np.array([-initial_investment] + cash_flows, dtype=float)
-
-    # Use numpy_financial.irr if available, otherwise scipy.optimize
-    try:
-        # Try using numpy.irr (deprecated but still available in some versions)
-        # More robust: use scipy.optimize.newton
-
-        def npv_func(rate):
-            """NPV as a function of discount rate."""
-            periods = np.arange(len(full_cf))
-            discount_factors = (1 + rate) ** periods
-            return np.sum(full_cf / discount_factors)
-
-        def npv_derivative(rate):
-            """Derivative of NPV with respect to discount rate."""
-            periods = np.arange(len(full_cf))
-            discount_factors = (1 + rate) ** (periods + 1)
-            return -np.sum(periods * full_cf / discount_factors)
-
-        # Initial guess: 10% IRR
-        irr = optimize.newton(
-            npv_func,
-            x0=0.10,
-            fprime=npv_derivative,
-            maxiter=max_iterations,
-            tol=tolerance,
-        )
+    full_cf = np.concatenate(([-initial_investment], cf_array))
+
+    irr = _irr_newton(full_cf, max_iterations, tolerance, guess)
+    if irr is None and len(full_cf) <= _IRR_POLYROOT_MAX_PERIODS:
+        try:
+            irr = _irr_from_polynomial_roots(full_cf, guess)
+        except np.linalg.LinAlgError as e:
+            logger.warning(f"IRR root solve failed: {e}")
+
+    return irr
 
-        # Validate result
-        if np.isnan(irr) or np.isinf(irr):
-            return None
 
-        return float(irr)
+# Longest cash flow stream (including period 0) retried via polynomial roots
+_IRR_POLYROOT_MAX_PERIODS = 30
 
-    except (RuntimeError, ValueError) as e:
-        # Newton's method failed to converge
-        logger.warning(f"IRR calculation failed to converge: {e}")
+
+def _irr_from_polynomial_roots(
+    full_cf: np.ndarray,
+    guess: float = _IRR_DEFAULT_GUESS
+) -> Optional[float]:
+    """
+    Solve IRR as the roots of Σ CFt · x^t with x = 1/(1+r).
+
+    Only real, positive x map to rates above -100%. The rate closest to
+    guess is returned when there are several.
+
+    Args:
+        full_cf: Cash flows including the period-0 investment
+        guess: Expected rate used to pick among multiple roots
+
+    Returns:
+        IRR as decimal or None if no real solution exists
+    """
+    # np.roots expects the highest-degree coefficient first
+    roots = np.roots(full_cf[::-1])
+    real_roots = roots[np.abs(roots.imag) < 1e-9].real
+    valid = real_roots[real_roots > 0]
+
+    if valid.size == 0:
+        logger.debug("IRR calculation found no real solution")
+        return None
+
+    irrs = 1.0 / valid - 1.0
+    return float(irrs[np.argmin(np.abs(irrs - guess))])
+
+
+def _irr_newton(
+    full_cf: np.ndarray,
+    max_iterations: int,
+    tolerance: float,
+    guess: float = _IRR_DEFAULT_GUESS
+) -> Optional[float]:
+    """
+    Solve IRR with Newton-Raphson from a bracketed starting rate.
+
+    Args:
+        full_cf: Cash flows including the period-0 investment
+        max_iterations: Maximum iterations for convergence
+        tolerance: Convergence tolerance
+        guess: Expected rate used to pick among bracketed roots
+
+    Returns:
+        IRR as decimal or None if Newton's method does not converge
+    """
+    periods = np.arange(len(full_cf), dtype=np.float64)
+    weighted_cf = periods * full_cf
+
+    # NPV and its derivative are evaluated together from one discount vector
+    # per iteration, started next to a bracketed sign change
+    with np.errstate(over='ignore', divide='ignore', invalid='ignore'):
+        rate = _irr_initial_guess(full_cf, periods, guess)
+        for _ in range(max_iterations):
+            npv, derivative = _npv_and_derivative(full_cf, weighted_cf, periods, rate)
+            if derivative == 0 or not np.isfinite(derivative):
+                logger.warning(
+                    f"IRR calculation failed to converge: zero derivative at rate {rate}"
+                )
+                return None
+
+            next_rate = rate - npv / derivative
+            if abs(next_rate - rate) < tolerance:
+                rate = next_rate
+                break
+            rate = next_rate
+        else:
+            # Newton's method failed to converge
+            logger.warning(
+                f"IRR calculation failed to converge after {max_iterations} iterations"
+            )
+            return None
+
+    # Validate result
+    if np.isnan(rate) or np.isinf(rate):
         return None
 
+    return float(rate)
+
+
+# Rates scanned to bracket the IRR before Newton-Raphson
+_IRR_SCAN_RATES = np.linspace(-0.9, 2.0, 32)
+
+
+def _irr_initial_guess(
+    full_cf: np.ndarray,
+    periods: np.ndarray,
+    guess: float = _IRR_DEFAULT_GUESS
+) -> float:
+    """
+    Choose a Newton-Raphson starting rate from a coarse NPV scan.
+
+    NPV is evaluated on a fixed grid of rates in one vectorized pass. Each
+    adjacent pair with a sign change brackets a root; the linearly
+    interpolated crossing closest to guess is returned so Newton starts on
+    the correct side of any extremum instead of diverging from a fixed guess.
+
+    Args:
+        full_cf: Cash flows including the period-0 investment
+        periods: Period index for each cash flow (0, 1, 2, ...)
+        guess: Expected rate used to pick among bracketed roots
+
+    Returns:
+        Starting rate (guess itself when the scan finds no sign change)
+    """
+    discount = np.power(1.0 + _IRR_SCAN_RATES, -periods[:, None])
+    npv_grid = full_cf @ discount
+
+    crossings = np.nonzero(np.signbit(npv_grid[:-1]) != np.signbit(npv_grid[1:]))[0]
+    if crossings.size == 0:
+        return guess
+
+    lo_rate = _IRR_SCAN_RATES[crossings]
+    hi_rate = _IRR_SCAN_RATES[crossings + 1]
+    lo_npv = npv_grid[crossings]
+    hi_npv = npv_grid[crossings + 1]
+    estimates = lo_rate - lo_npv * (hi_rate - lo_rate) / (hi_npv - lo_npv)
+
+    return float(estimates[np.argmin(np.abs(estimates - guess))])
+
+
+def _npv_and_derivative(
+    full_cf: np.ndarray,
+    weighted_cf: np.ndarray,
+    periods: np.ndarray,
+    rate: float
+) -> Tuple[float, float]:
+    """
+    Evaluate NPV and dNPV/dr at a rate from a single discount vector.
+
+    f(r)  = Σ CFt / (1+r)^t
+    f'(r) = -Σ t·CFt / (1+r)^(t+1)
+
+    Args:
+        full_cf: Cash flows including the period-0 investment
+        weighted_cf: periods * full_cf, precomputed by the caller
+        periods: Period index for each cash flow (0, 1, 2, ...)
+        rate: Discount rate to evaluate at
+
+    Returns:
+        Tuple of (npv, derivative)
+    """
+    discount = np.power(1.0 + rate, -periods)
+    npv = float(full_cf @ discount)
+    derivative = -float(weighted_cf @ discount) / (1.0 + rate)
+    return npv, derivative
+
 
 def calculate_payback_period(
     cash_flows: List[float],
@@ -383,10 +561,20 @@ def calculate_profitability_index(
 # ============================================================================
 
 
+# Scenario keys sampled by run_monte_carlo_simulation, in sample-matrix column order
+MONTE_CARLO_VARIABLES: Tuple[str, ...] = (
+    'cost_per_sf',
+    'rent_growth_rate',
+    'exit_cap_rate',
+    'construction_delay_months',
+)
+
+
 def calculate_tornado_sensitivity(
     base_scenario: Dict[str, Any],
     variables_to_test: List[SensitivityInput],
-    npv_function: Callable[[Dict[str, Any]], float]
+    npv_function: Callable[[Dict[str, Any]], float],
+    batch_npv_function: Optional[Callable[[Dict[str, np.ndarray]], np.ndarray]] = None
 ) -> List[TornadoResult]:
     """
     Perform one-way sensitivity analysis (Tornado diagram).
@@ -400,7 +588,15 @@ def calculate_tornado_sensitivity(
     Args:
         base_scenario: Base case parameters as dict
         variables_to_test: List of variables to test with delta percentages
-        npv_function: Function that takes scenario dict and returns NPV
+        npv_function: Function that takes scenario dict and returns NPV. The
+            dict is reused between calls, so it must not be retained or mutated.
+        batch_npv_function: Optional vectorized alternative to npv_function,
+            with the same contract as in run_monte_carlo_simulation. All
+            downside/upside scenarios are stacked into one call: it receives a
+            dict mapping each tested variable to an array of 2·K values (rows
+            2i and 2i+1 perturb variable i, every other row holds its base
+            value). Used only when every tested variable is in base_scenario;
+            the base NPV always comes from npv_function.
 
     Returns:
         List of TornadoResult sorted by impact (descending)
@@ -422,22 +618,63 @@ def calculate_tornado_sensitivity(
     # Calculate base NPV
     base_npv = npv_function(base_scenario)
 
-    for variable in variables_to_test:
-        # Create scenario copies for testing
-        downside_scenario = base_scenario.copy()
-        upside_scenario = base_scenario.copy()
-
-        # Calculate downside and upside values
-        downside_value = variable.base_value * (1 - variable.delta_pct)
-        upside_value = variable.base_value * (1 + variable.delta_pct)
-
-        # Update scenarios
-        downside_scenario[variable.variable_name] = downside_value
-        upside_scenario[variable.variable_name] = upside_value
+    # Single working scenario; each variable is overridden and then restored
+    scenario = dict(base_scenario)
+
+    # NPVs already computed this run, keyed by the single overridden
+    # (variable, value). A perturbation that lands on the base value (e.g.
+    # ±50% of a zero delay) or repeats an earlier one is not re-evaluated.
+    evaluated: Dict[Tuple[str, Any], float] = {}
+
+    def scenario_npv(name: str, value: Any) -> float:
+        if name in base_scenario and base_scenario[name] == value:
+            return base_npv
+        key = (name, value)
+        if key not in evaluated:
+            scenario[name] = value
+            evaluated[key] = npv_function(scenario)
+        return evaluated[key]
+
+    # Downside and upside values for every variable, in order
+    perturbations = [
+        (
+            variable.base_value * (1 - variable.delta_pct),
+            variable.base_value * (1 + variable.delta_pct),
+        )
+        for variable in variables_to_test
+    ]
+
+    if batch_npv_function is not None and perturbations and all(
+        variable.variable_name in base_scenario for variable in variables_to_test
+    ):
+        # Stack all 2K one-variable scenarios and value them in a single call
+        num_scenarios = 2 * len(variables_to_test)
+        columns = {
+            variable.variable_name: np.full(
+                num_scenarios, base_scenario[variable.variable_name], dtype=np.float64
+            )
+            for variable in variables_to_test
+        }
+        for i, (variable, values) in enumerate(zip(variables_to_test, perturbations)):
+            columns[variable.variable_name][2 * i:2 * i + 2] = values
+        batch_npvs = np.asarray(batch_npv_function(columns), dtype=np.float64).tolist()
+
+        for i, (variable, values) in enumerate(zip(variables_to_test, perturbations)):
+            for value, npv in zip(values, batch_npvs[2 * i:2 * i + 2]):
+                evaluated.setdefault((variable.variable_name, value), npv)
+
+    for variable, (downside_value, upside_value) in zip(variables_to_test, perturbations):
+        name = variable.variable_name
 
         # Calculate NPVs
-        downside_npv = npv_function(downside_scenario)
-        upside_npv = npv_function(upside_scenario)
+        downside_npv = scenario_npv(name, downside_value)
+        upside_npv = scenario_npv(name, upside_value)
+
+        # Restore base value
+        if name in base_scenario:
+            scenario[name] = base_scenario[name]
+        else:
+            scenario.pop(name, None)
 
         # Calculate impact
         impact = abs(upside_npv - downside_npv)
@@ -462,7 +699,8 @@ def calculate_tornado_sensitivity(
 def run_monte_carlo_simulation(
     base_params: Dict[str, Any],
     monte_carlo_inputs: MonteCarloInputs,
-    npv_function: Callable[[Dict[str, Any]], float]
+    npv_function: Callable[[Dict[str, Any]], float],
+    batch_npv_function: Optional[Callable[[Dict[str, np.ndarray]], np.ndarray]] = None
 ) -> MonteCarloResult:
     """
     Run Monte Carlo simulation with vectorized NumPy operations.
@@ -471,12 +709,20 @@ def run_monte_carlo_simulation(
     - cost_per_sf: Normal(μ=base, σ=cost_per_sf_std)
     - rent_growth: Normal(μ=base, σ=rent_growth_std), clipped at 0
     - cap_rate: Triangular(min, mode, max)
-    - construction_delay: Lognormal(μ=delay_mean, σ=delay_std)
+    - construction_delay: Lognormal with mean=delay_mean, std=delay_std
+      (Normal(delay_mean, delay_std) clamped at 0 when delay_mean <= 0)
 
     Args:
         base_params: Base case parameters
         monte_carlo_inputs: Monte Carlo configuration
-        npv_function: Function that takes params dict and returns NPV
+        npv_function: Function that takes params dict and returns NPV. The
+            dict is reused between iterations, so it must not be retained or
+            mutated. Must be picklable (module-level function or
+            functools.partial) when monte_carlo_inputs.workers > 1.
+        batch_npv_function: Optional vectorized alternative to npv_function.
+            Called with a dict mapping each MONTE_CARLO_VARIABLES name to its
+            array of samples (once, or once per worker chunk); returns the
+            array of NPVs. When given it is used instead of npv_function.
 
     Returns:
         MonteCarloResult with statistics and distribution
@@ -484,16 +730,16 @@ def run_monte_carlo_simulation(
     Performance:
         Must complete 10,000 iterations in <2 seconds (vectorized NumPy).
     """
-    # Set random seed for reproducibility
-    np.random.seed(monte_carlo_inputs.seed)
+    # Dedicated generator for reproducibility; the global NumPy RNG state is
+    # left untouched
+    rng = np.random.Generator(np.random.PCG64DXSM(monte_carlo_inputs.seed))
 
     n = monte_carlo_inputs.iterations
-    npv_results = np.zeros(n)
 
     # Pre-generate all random samples (vectorized)
     # Cost per SF: Normal distribution
     cost_per_sf_base = base_params.get('cost_per_sf', 400)
-    cost_samples = np.random.normal(
+    cost_samples = rng.normal(
         loc=cost_per_sf_base,
         scale=monte_carlo_inputs.cost_per_sf_std,
         size=n
@@ -502,7 +748,7 @@ def run_monte_carlo_simulation(
     # Rent growth: Normal distribution, clipped at 0
     rent_growth_base = base_params.get('rent_growth_rate', 0.03)
     rent_growth_samples = np.clip(
-        np.random.normal(
+        rng.normal(
             loc=rent_growth_base,
             scale=monte_carlo_inputs.rent_growth_std,
             size=n
@@ -512,7 +758,7 @@ def run_monte_carlo_simulation(
     )
 
     # Exit cap rate: Triangular distribution
-    cap_rate_samples = np.random.triangular(
+    cap_rate_samples = rng.triangular(
         left=monte_carlo_inputs.cap_rate_min,
         mode=monte_carlo_inputs.cap_rate_mode,
         right=monte_carlo_inputs.cap_rate_max,
@@ -521,55 +767,69 @@ def run_monte_carlo_simulation(
 
     # Construction delay: Lognormal distribution (in months)
     # Lognormal is used because delays are always positive and right-skewed
-    if monte_carlo_inputs.construction_delay_std > 0:
-        # Convert mean and std to lognormal parameters
-        mu = monte_carlo_inputs.construction_delay_mean
-        sigma = monte_carlo_inputs.construction_delay_std
-
-        # For lognormal, if X ~ Lognormal(μ, σ²), then:
-        # E[X] = exp(μ + σ²/2)
-        # Var[X] = (exp(σ²) - 1) * exp(2μ + σ²)
-        # We want to parameterize by mean and std of the delay
-        # For small delays, approximate with normal clamped at 0
-        delay_samples = np.maximum(
-            np.random.normal(loc=mu, scale=sigma, size=n),
-            0
-        )
-    else:
-        delay_samples = np.zeros(n)
-
-    # Run iterations (can't fully vectorize NPV calculation due to complex logic)
-    # However, we can batch process to minimize overhead
-    for i in range(n):
-        # Create scenario with sampled parameters
-        scenario = base_params.copy()
-        scenario['cost_per_sf'] = cost_samples[i]
-        scenario['rent_growth_rate'] = rent_growth_samples[i]
-        scenario['exit_cap_rate'] = cap_rate_samples[i]
-        scenario['construction_delay_months'] = delay_samples[i]
+    delay_samples = _sample_construction_delay(
+        rng,
+        mean=monte_carlo_inputs.construction_delay_mean,
+        std=monte_carlo_inputs.construction_delay_std,
+        size=n
+    )
 
-        # Calculate NPV for this scenario
-        npv_results[i] = npv_function(scenario)
+    # Stack samples into an (n, k) matrix ordered by MONTE_CARLO_VARIABLES
+    sample_matrix = np.column_stack(
+        (cost_samples, rent_growth_samples, cap_rate_samples, delay_samples)
+    )
+
+    # None means one worker per CPU core
+    workers = min(monte_carlo_inputs.workers or os.cpu_count() or 1, n)
+    if workers > 1:
+        # Scenarios are independent, so contiguous row chunks are evaluated in
+        # separate processes and concatenated back in order
+        chunks = np.array_split(sample_matrix, workers)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            if batch_npv_function is not None:
+                npv_chunks = executor.map(
+                    _evaluate_scenario_batch,
+                    [batch_npv_function] * workers,
+                    chunks,
+                )
+            else:
+                npv_chunks = executor.map(
+                    _evaluate_scenarios,
+                    [npv_function] * workers,
+                    [base_params] * workers,
+                    chunks,
+                )
+            npv_results = np.concatenate(list(npv_chunks))
+    elif batch_npv_function is not None:
+        # All iterations in one vectorized evaluation
+        npv_results = _evaluate_scenario_batch(batch_npv_function, sample_matrix)
+    else:
+        # Per-scenario evaluation for NPV functions with arbitrary logic
+        npv_results = _evaluate_scenarios(npv_function, base_params, sample_matrix)
 
     # Calculate statistics
-    probability_positive = float(np.mean(npv_results > 0))
+    probability_positive = float(np.count_nonzero(npv_results > 0)) / n
     mean_npv = float(np.mean(npv_results))
-    median_npv = float(np.median(npv_results))
-    std_npv = float(np.std(npv_results))
+    # Population std from the mean above (np.std would recompute the mean)
+    deviations = npv_results - mean_npv
+    std_npv = float(np.sqrt(np.dot(deviations, deviations) / n))
 
-    # Calculate percentiles
-    percentile_5 = float(np.percentile(npv_results, 5))
-    percentile_25 = float(np.percentile(npv_results, 25))
-    percentile_75 = float(np.percentile(npv_results, 75))
-    percentile_95 = float(np.percentile(npv_results, 95))
+    # Calculate percentiles in a single partition pass (median is the 50th);
+    # the 0th and 100th give the histogram range without separate min/max scans
+    (
+        min_npv, percentile_5, percentile_25, median_npv,
+        percentile_75, percentile_95, max_npv
+    ) = (float(p) for p in np.percentile(npv_results, [0, 5, 25, 50, 75, 95, 100]))
 
     # Generate histogram for visualization
     # Use 50 bins for good granularity
-    histogram_counts, histogram_bins = np.histogram(npv_results, bins=50)
+    histogram_counts, histogram_bins = _histogram(
+        npv_results, num_bins=50, value_range=(min_npv, max_npv)
+    )
 
     return MonteCarloResult(
         iterations=n,
-        npv_array=npv_results,
+        npv_array=npv_results if monte_carlo_inputs.retain_samples else None,
         probability_positive=probability_positive,
         mean_npv=mean_npv,
         median_npv=median_npv,
@@ -583,6 +843,144 @@ def run_monte_carlo_simulation(
     )
 
 
+def _evaluate_scenario_batch(
+    batch_npv_function: Callable[[Dict[str, np.ndarray]], np.ndarray],
+    sample_matrix: np.ndarray
+) -> np.ndarray:
+    """
+    Evaluate a vectorized NPV function over a Monte Carlo sample matrix.
+
+    Module-level so it can run in a worker process.
+
+    Args:
+        batch_npv_function: Function that maps sample columns to NPVs
+        sample_matrix: (n, k) samples ordered by MONTE_CARLO_VARIABLES
+
+    Returns:
+        Array of n NPVs
+    """
+    return np.asarray(
+        batch_npv_function(dict(zip(MONTE_CARLO_VARIABLES, sample_matrix.T))),
+        dtype=np.float64
+    )
+
+
+def _evaluate_scenarios(
+    npv_function: Callable[[Dict[str, Any]], float],
+    base_params: Dict[str, Any],
+    sample_matrix: np.ndarray
+) -> np.ndarray:
+    """
+    Evaluate NPV for each row of a Monte Carlo sample matrix.
+
+    Module-level so it can run in a worker process.
+
+    Args:
+        npv_function: Function that takes params dict and returns NPV
+        base_params: Base case parameters
+        sample_matrix: (n, k) samples ordered by MONTE_CARLO_VARIABLES
+
+    Returns:
+        Array of n NPVs
+    """
+    npv_results = np.empty(len(sample_matrix))
+
+    # A single working scenario dict is updated in place rather than copying
+    # base_params on every iteration
+    scenario = dict(base_params)
+    for i, row in enumerate(sample_matrix.tolist()):
+        scenario.update(zip(MONTE_CARLO_VARIABLES, row))
+
+        # Calculate NPV for this scenario
+        npv_results[i] = npv_function(scenario)
+
+    return npv_results
+
+
+def _sample_construction_delay(
+    rng: np.random.Generator,
+    mean: float,
+    std: float,
+    size: int
+) -> np.ndarray:
+    """
+    Draw construction delays (months) with the requested mean and std.
+
+    For X ~ Lognormal(μ, σ²):
+        E[X] = exp(μ + σ²/2)
+        Var[X] = (exp(σ²) - 1) * exp(2μ + σ²)
+
+    Solving for the desired mean m and std s:
+        σ² = ln(1 + (s/m)²)
+        μ = ln(m) - σ²/2
+
+    A lognormal needs a positive mean. For mean <= 0 (the default config
+    has mean 0, std 3) delays keep the original draw, Normal(mean, std)
+    clamped at zero, so default Monte Carlo results are unchanged.
+
+    Args:
+        rng: Random generator to draw from
+        mean: Desired mean delay in months
+        std: Desired standard deviation in months
+        size: Number of samples
+
+    Returns:
+        Array of non-negative delays in months
+    """
+    if std <= 0:
+        return np.full(size, max(mean, 0.0))
+
+    if mean <= 0:
+        return np.maximum(rng.normal(loc=mean, scale=std, size=size), 0)
+
+    sigma = np.sqrt(np.log1p((std / mean) ** 2))
+    mu = np.log(mean) - sigma ** 2 / 2
+    return rng.lognormal(mean=mu, sigma=sigma, size=size)
+
+
+def _histogram(
+    values: np.ndarray,
+    num_bins: int = 50,
+    value_range: Optional[Tuple[float, float]] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Bin values into equal-width bins spanning [min, max].
+
+    Bin indices are computed arithmetically from the offset within the range
+    (no per-sample binary search), corrected by one bin wherever rounding
+    puts a value on the wrong side of its linspace edge, and counted with
+    bincount. This matches np.histogram(values, bins=num_bins) (last bin
+    closed on the right) without its general-purpose overhead.
+
+    Args:
+        values: Sample values (e.g., Monte Carlo NPVs)
+        num_bins: Number of equal-width bins
+        value_range: Precomputed (min, max) of values, if already known
+
+    Returns:
+        Tuple of (counts, bin_edges) with lengths num_bins and num_bins + 1
+    """
+    if value_range is None:
+        lo, hi = float(values.min()), float(values.max())
+    else:
+        lo, hi = value_range
+    if lo == hi:
+        # Same convention as np.histogram for a degenerate range
+        lo, hi = lo - 0.5, hi + 0.5
+
+    edges = np.linspace(lo, hi, num_bins + 1)
+    indices = ((values - lo) * (num_bins / (hi - lo))).astype(np.intp)
+    np.clip(indices, 0, num_bins - 1, out=indices)
+
+    # Bin i is [edges[i], edges[i+1]); fix values rounded into a neighbour
+    indices -= values < edges[indices]
+    indices += (values >= edges[indices + 1]) & (indices < num_bins - 1)
+
+    counts = np.bincount(indices, minlength=num_bins)
+
+    return counts, edges
+
+
 # ============================================================================
 # Development Cash Flow Functions
 # ============================================================================
@@ -623,90 +1021,365 @@ def generate_development_cash_flows(
         >>> len(cfs) > 0
         True
     """
-    cash_flows = []
-    cumulative = 0.0
-    period = 0
+    components, weights, phases, descriptions = _cash_flow_schedule(
+        timeline.predevelopment_months,
+        timeline.construction_months,
+        timeline.lease_up_months,
+        timeline.operations_years
+    )
+    values = _cash_flow_values(
+        total_construction_cost, annual_noi, timeline,
+        exit_cap_rate, soft_cost_pct, predevelopment_spend_pct
+    )
+    amounts = [values[component] * weight for component, weight in zip(components, weights)]
+
+    descriptions = descriptions + (f"Exit (Sale at {exit_cap_rate*100:.1f}% cap rate)",)
+
+    return [
+        CashFlow(
+            period=period,
+            description=description,
+            amount=amount,
+            cumulative=running_total,
+            phase=phase
+        )
+        for period, (description, amount, running_total, phase) in enumerate(
+            zip(descriptions, amounts, accumulate(amounts), phases)
+        )
+    ]
+
+
+def generate_development_cash_flow_amounts(
+    total_construction_cost: float,
+    annual_noi: float,
+    timeline: TimelineInputs,
+    exit_cap_rate: float,
+    soft_cost_pct: float = 0.20,
+    predevelopment_spend_pct: float = 0.50
+) -> np.ndarray:
+    """
+    Cash-flow amounts of generate_development_cash_flows as an array.
+
+    For scenario NPV runs that only need the amounts: no CashFlow objects,
+    descriptions or running totals are built.
+
+    Args:
+        total_construction_cost: Total development cost (hard + soft)
+        annual_noi: Stabilized annual Net Operating Income
+        timeline: Development timeline parameters
+        exit_cap_rate: Exit cap rate for sale valuation
+        soft_cost_pct: Soft costs as % of total cost (default 20%)
+        predevelopment_spend_pct: % of soft costs spent in predevelopment (default 50%)
+
+    Returns:
+        Array of cash-flow amounts, period 0 first
+    """
+    components, weights, _, _ = _cash_flow_schedule(
+        timeline.predevelopment_months,
+        timeline.construction_months,
+        timeline.lease_up_months,
+        timeline.operations_years
+    )
+    values = np.array(_cash_flow_values(
+        total_construction_cost, annual_noi, timeline,
+        exit_cap_rate, soft_cost_pct, predevelopment_spend_pct
+    ))
+    return values[np.array(components, dtype=np.intp)] * np.array(weights)
+
+
+def generate_development_cash_flow_columns(
+    total_construction_cost: float,
+    annual_noi: float,
+    timeline: TimelineInputs,
+    exit_cap_rate: float,
+    soft_cost_pct: float = 0.20,
+    predevelopment_spend_pct: float = 0.50
+) -> Dict[str, List[Any]]:
+    """
+    Cash flows of generate_development_cash_flows as parallel columns.
+
+    Builds each field as one plain Python list straight from the cached
+    period layout, without a CashFlow object per period. Amounts come from
+    generate_development_cash_flow_amounts and are converted with tolist(),
+    so no column is an ndarray; the lists feed CashFlowSeries directly.
+
+    Args:
+        total_construction_cost: Total development cost (hard + soft)
+        annual_noi: Stabilized annual Net Operating Income
+        timeline: Development timeline parameters
+        exit_cap_rate: Exit cap rate for sale valuation
+        soft_cost_pct: Soft costs as % of total cost (default 20%)
+        predevelopment_spend_pct: % of soft costs spent in predevelopment (default 50%)
+
+    Returns:
+        Dict with 'period', 'description', 'amount', 'cumulative' and
+        'phase' Python lists, period 0 first
+    """
+    _, _, phases, descriptions = _cash_flow_schedule(
+        timeline.predevelopment_months,
+        timeline.construction_months,
+        timeline.lease_up_months,
+        timeline.operations_years
+    )
+    amounts = generate_development_cash_flow_amounts(
+        total_construction_cost, annual_noi, timeline,
+        exit_cap_rate, soft_cost_pct, predevelopment_spend_pct
+    ).tolist()
+
+    return {
+        'period': list(range(len(amounts))),
+        'description': [
+            *descriptions,
+            f"Exit (Sale at {exit_cap_rate*100:.1f}% cap rate)"
+        ],
+        'amount': amounts,
+        'cumulative': list(accumulate(amounts)),
+        'phase': list(phases)
+    }
+
+
+# Scenario values a cash-flow period can carry, indexed by _cash_flow_schedule
+_PREDEVELOPMENT, _CONSTRUCTION, _NOI, _EXIT = range(4)
+
+
+@lru_cache(maxsize=64)
+def _cash_flow_schedule(
+    predevelopment_months: int,
+    construction_months: int,
+    lease_up_months: int,
+    operations_years: int
+) -> Tuple[Tuple[int, ...], Tuple[float, ...], Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Period layout of a development timeline, independent of any amounts.
+
+    The timeline alone fixes how many periods each phase has, which value
+    (predevelopment spend, construction draw, NOI or sale proceeds) each
+    period carries and at what weight (the lease-up occupancy ramp), and
+    every description except the exit's. Cached so scenarios sharing a
+    timeline only scale these weights by their own values.
+
+    Args:
+        predevelopment_months: Predevelopment phase duration
+        construction_months: Construction phase duration
+        lease_up_months: Lease-up phase duration
+        operations_years: Stabilized operations years before sale
+
+    Returns:
+        Tuple of (component index per period, weight per period, phase per
+        period, description per period excluding the exit)
+    """
+    components: List[int] = []
+    weights: List[float] = []
+    phases: List[str] = []
+    descriptions: List[str] = []
+
+    # Phase 1: Predevelopment
+    if predevelopment_months / 12.0 > 0:
+        components.append(_PREDEVELOPMENT)
+        weights.append(-1.0)
+        phases.append("predevelopment")
+        descriptions.append(f"Predevelopment ({predevelopment_months} months)")
+
+    # Phase 2: Construction (linear draws)
+    construction_periods = int(np.ceil(construction_months / 12.0))
+    for i in range(construction_periods):
+        components.append(_CONSTRUCTION)
+        weights.append(-1.0)
+        phases.append("construction")
+        descriptions.append(f"Construction Year {i+1}")
+
+    # Phase 3: Lease-up, ramping linearly from 0% to 100% occupancy
+    lease_up_periods = int(np.ceil(lease_up_months / 12.0))
+    for i in range(lease_up_periods):
+        occupancy_pct = (i + 1) / lease_up_periods
+        components.append(_NOI)
+        weights.append(occupancy_pct)
+        phases.append("lease_up")
+        descriptions.append(f"Lease-up Year {i+1} ({occupancy_pct*100:.0f}% occupied)")
+
+    # Phase 4: Stabilized Operations
+    for i in range(operations_years):
+        components.append(_NOI)
+        weights.append(1.0)
+        phases.append("operations")
+        descriptions.append(f"Operations Year {i+1}")
+
+    # Phase 5: Exit (Sale); its description depends on the cap rate
+    components.append(_EXIT)
+    weights.append(1.0)
+    phases.append("exit")
+
+    return tuple(components), tuple(weights), tuple(phases), tuple(descriptions)
+
+
+def _cash_flow_values(
+    total_construction_cost: float,
+    annual_noi: float,
+    timeline: TimelineInputs,
+    exit_cap_rate: float,
+    soft_cost_pct: float,
+    predevelopment_spend_pct: float
+) -> Tuple[float, float, float, float]:
+    """
+    One scenario's per-period values, indexed like _cash_flow_schedule.
+
+    Args:
+        total_construction_cost: Total development cost (hard + soft)
+        annual_noi: Stabilized annual Net Operating Income
+        timeline: Development timeline parameters
+        exit_cap_rate: Exit cap rate for sale valuation
+        soft_cost_pct: Soft costs as % of total cost
+        predevelopment_spend_pct: % of soft costs spent in predevelopment
 
+    Returns:
+        Tuple of (predevelopment spend, construction draw per period,
+        annual NOI, sale proceeds)
+    """
     # Calculate cost components
     soft_costs = total_construction_cost * soft_cost_pct
     hard_costs = total_construction_cost - soft_costs
     predevelopment_costs = soft_costs * predevelopment_spend_pct
     construction_soft_costs = soft_costs - predevelopment_costs
 
-    # Phase 1: Predevelopment
-    predevelopment_years = timeline.predevelopment_months / 12.0
-    if predevelopment_years > 0:
-        cash_flows.append(CashFlow(
-            period=period,
-            description=f"Predevelopment ({timeline.predevelopment_months} months)",
-            amount=-predevelopment_costs,
-            cumulative=cumulative - predevelopment_costs,
-            phase="predevelopment"
-        ))
-        cumulative -= predevelopment_costs
-        period += 1
+    construction_periods = int(np.ceil(timeline.construction_months / 12.0))
+    construction_draw_per_period = (hard_costs + construction_soft_costs) / construction_periods
 
-    # Phase 2: Construction
-    construction_years = timeline.construction_months / 12.0
-    construction_periods = int(np.ceil(construction_years))
+    return (
+        predevelopment_costs,
+        construction_draw_per_period,
+        annual_noi,
+        calculate_exit_value(annual_noi, exit_cap_rate),
+    )
 
-    total_construction_outlay = hard_costs + construction_soft_costs
-    construction_draw_per_period = total_construction_outlay / construction_periods
 
-    for i in range(construction_periods):
-        cash_flows.append(CashFlow(
-            period=period,
-            description=f"Construction Year {i+1}",
-            amount=-construction_draw_per_period,
-            cumulative=cumulative - construction_draw_per_period,
-            phase="construction"
-        ))
-        cumulative -= construction_draw_per_period
-        period += 1
+@lru_cache(maxsize=256)
+def _phase_discount_sums(
+    discount_rate: float,
+    lease_up_periods: int,
+    operations_periods: int
+) -> Tuple[float, float]:
+    """
+    Discount sums for the fixed-length lease-up and operations phases.
 
-    # Phase 3: Lease-up
-    lease_up_years = timeline.lease_up_months / 12.0
-    lease_up_periods = int(np.ceil(lease_up_years))
+    Both depend only on the rate and the phase lengths, so they are cached
+    alongside _discount_factors and shared by every Monte Carlo batch.
 
-    for i in range(lease_up_periods):
-        # Linear ramp from 0% to 100% occupancy
-        occupancy_pct = (i + 1) / lease_up_periods
-        lease_up_noi = annual_noi * occupancy_pct
+    Args:
+        discount_rate: Annual discount rate
+        lease_up_periods: Number of lease-up periods (L)
+        operations_periods: Number of operating years (O)
 
-        cash_flows.append(CashFlow(
-            period=period,
-            description=f"Lease-up Year {i+1} ({occupancy_pct*100:.0f}% occupied)",
-            amount=lease_up_noi,
-            cumulative=cumulative + lease_up_noi,
-            phase="lease_up"
-        ))
-        cumulative += lease_up_noi
-        period += 1
+    Returns:
+        Tuple of (Σ (i+1)·v^i for i < L, Σ v^i for i < O), with v = 1/(1+r)
+    """
+    growth = 1.0 + discount_rate
+    lease_up_weights = _discount_factors(discount_rate, lease_up_periods)
+    lease_up_ramp = float(np.arange(1, lease_up_periods + 1) @ lease_up_weights) * growth
+    operations_annuity = float(_discount_factors(discount_rate, operations_periods).sum()) * growth
+    return lease_up_ramp, operations_annuity
+
+
+def calculate_development_present_values(
+    total_construction_cost: Union[float, np.ndarray],
+    annual_noi: Union[float, np.ndarray],
+    construction_months: Union[float, np.ndarray],
+    exit_cap_rate: Union[float, np.ndarray],
+    timeline: TimelineInputs,
+    discount_rate: float,
+    soft_cost_pct: float = 0.20,
+    predevelopment_spend_pct: float = 0.50,
+    include_first_period: bool = True
+) -> np.ndarray:
+    """
+    Present value of development cash flows for many scenarios, in closed form.
 
-    # Phase 4: Stabilized Operations
-    for i in range(timeline.operations_years):
-        cash_flows.append(CashFlow(
-            period=period,
-            description=f"Operations Year {i+1}",
-            amount=annual_noi,
-            cumulative=cumulative + annual_noi,
-            phase="operations"
-        ))
-        cumulative += annual_noi
-        period += 1
-
-    # Phase 5: Exit (Sale)
-    exit_value = calculate_exit_value(annual_noi, exit_cap_rate)
-
-    cash_flows.append(CashFlow(
-        period=period,
-        description=f"Exit (Sale at {exit_cap_rate*100:.1f}% cap rate)",
-        amount=exit_value,
-        cumulative=cumulative + exit_value,
-        phase="exit"
-    ))
+    Equivalent to discounting each scenario's generate_development_cash_flows
+    amounts with period k weighted by v^k, v = 1/(1+r), but without building
+    any cash flows. Each phase is a short geometric series, so every scenario costs a
+    few array operations regardless of holding period:
+
+        construction:  -draw · v^p · (1 - v^c) / (1 - v)
+        lease-up:      NOI / L · v^(p+c) · Σ (i+1) v^i   (i < L)
+        operations:    NOI · v^(p+c+L) · (1 - v^O) / (1 - v)
+        exit:          NOI / cap · v^(p+c+L+O)
+
+    where p is 1 with a predevelopment period (itself undiscounted) and 0
+    otherwise, c the construction periods, L the lease-up periods and O the
+    operating years.
+
+    Args:
+        total_construction_cost: Total development cost (hard + soft)
+        annual_noi: Stabilized annual Net Operating Income
+        construction_months: Construction duration in months
+        exit_cap_rate: Exit cap rate for sale valuation
+        timeline: Development timeline (construction_months is ignored)
+        discount_rate: Annual discount rate
+        soft_cost_pct: Soft costs as % of total cost (default 20%)
+        predevelopment_spend_pct: % of soft costs spent in predevelopment (default 50%)
+        include_first_period: Include the period-0 cash flow. Pass False to
+            value only periods 1..n, as when period 0 is replaced by an
+            explicit initial investment.
+
+    Returns:
+        Array of present values, one per scenario
+
+    Raises:
+        ValueError: If any construction duration or exit cap rate is not positive
+    """
+    total_cost, noi, months, cap_rate = np.broadcast_arrays(
+        np.asarray(total_construction_cost, dtype=np.float64).reshape(-1),
+        np.asarray(annual_noi, dtype=np.float64).reshape(-1),
+        np.asarray(construction_months, dtype=np.float64).reshape(-1),
+        np.asarray(exit_cap_rate, dtype=np.float64).reshape(-1),
+    )
+    if np.any(cap_rate <= 0):
+        raise ValueError("Exit cap rate must be positive")
+
+    construction_periods = np.ceil(months / 12.0)
+    if np.any(construction_periods <= 0):
+        raise ValueError("Construction duration must be positive")
+
+    lease_up_periods = int(np.ceil(timeline.lease_up_months / 12.0))
+    operations_periods = timeline.operations_years
+    offset = 1 if timeline.predevelopment_months > 0 else 0
+
+    # Cost components
+    soft_costs = total_cost * soft_cost_pct
+    predevelopment_costs = soft_costs * predevelopment_spend_pct
+    construction_draw = (total_cost - predevelopment_costs) / construction_periods
+
+    # Phase-length discount sums that do not depend on the scenario
+    v = 1.0 / (1.0 + discount_rate)
+    lease_up_ramp, operations_annuity = _phase_discount_sums(
+        float(discount_rate), lease_up_periods, operations_periods
+    )
+
+    # Discount from period 0 to the start of each phase
+    construction_start = v ** offset
+    lease_up_start = np.power(v, offset + construction_periods)
+    operations_start = lease_up_start * v ** lease_up_periods
+    exit_period = operations_start * v ** operations_periods
+
+    # Σ v^k for k < c, over the construction periods
+    construction_annuity = (
+        (1.0 - np.power(v, construction_periods)) / (1.0 - v)
+        if v != 1.0 else construction_periods
+    )
+
+    present_values = (
+        -construction_draw * construction_start * construction_annuity
+        + (noi / lease_up_periods * lease_up_start * lease_up_ramp if lease_up_periods else 0.0)
+        + noi * operations_start * operations_annuity
+        + noi / cap_rate * exit_period
+    )
+
+    # Period 0 holds the predevelopment spend, or else the first construction draw
+    if offset and include_first_period:
+        present_values = present_values - predevelopment_costs
+    elif not offset and not include_first_period:
+        present_values = present_values + construction_draw
 
-    return cash_flows
+    return present_values
 
 
 def calculate_exit_value(
@@ -1,15 +1,44 @@
 """
 Security utilities for authentication and password management.
 """
-from datetime import datetime, timedelta
-from typing import Optional
-from jose import jwt, JWTError
-from passlib.context import CryptContext
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from functools import lru_cache
+from typing import Optional, Tuple
+import bcrypt
+import jwt
+from jwt import InvalidTokenError
 from app.core.config import settings
 from app.models.user import TokenPayload
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt only uses the first 72 bytes of a password
+BCRYPT_MAX_PASSWORD_BYTES = 72
+
+# Recently verified tokens: blake2b(key fingerprint, token) -> (cached_until,
+# payload), LRU order. Entries are keyed on the algorithm and verification key,
+# so rotating JWT_SECRET_KEY/JWT_PUBLIC_KEY or switching JWT_ALGORITHM stops
+# serving them at once. Anything else that should reject an already-verified
+# token (e.g. a future server-side revocation list) must call
+# clear_token_cache(); otherwise the token is still accepted for up to
+# TOKEN_CACHE_TTL_SECONDS, and never past its own exp.
+TOKEN_CACHE_MAX_SIZE = 10_000
+TOKEN_CACHE_TTL_SECONDS = 60
+_token_cache: "OrderedDict[bytes, Tuple[float, TokenPayload]]" = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+# HMAC JWT algorithms that are signed locally with hashlib
+_HMAC_DIGESTS = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -21,22 +50,142 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         hashed_password: Bcrypt hashed password from database
 
     Returns:
-        True if password matches, False otherwise
+        True if password matches, False otherwise (including malformed hashes)
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    try:
+        return bcrypt.checkpw(
+            plain_password.encode("utf-8")[:BCRYPT_MAX_PASSWORD_BYTES],
+            hashed_password.encode("utf-8"),
+        )
+    except ValueError:
+        return False
 
 
 def get_password_hash(password: str) -> str:
     """
     Hash a plaintext password using bcrypt.
 
+    The cost factor is taken from settings.BCRYPT_ROUNDS.
+
     Args:
         password: Plaintext password to hash
 
     Returns:
         Bcrypt hashed password string
     """
-    return pwd_context.hash(password)
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    return bcrypt.hashpw(password.encode("utf-8")[:BCRYPT_MAX_PASSWORD_BYTES], salt).decode("utf-8")
+
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password in a worker thread.
+
+    bcrypt is deliberately slow; running it off the event loop keeps other
+    requests flowing while a login is being checked.
+
+    Args:
+        plain_password: Plaintext password from user input
+        hashed_password: Bcrypt hashed password from database
+
+    Returns:
+        True if password matches, False otherwise
+    """
+    return await asyncio.to_thread(verify_password, plain_password, hashed_password)
+
+
+async def aget_password_hash(password: str) -> str:
+    """
+    Hash a password in a worker thread.
+
+    Args:
+        password: Plaintext password to hash
+
+    Returns:
+        Bcrypt hashed password string
+    """
+    return await asyncio.to_thread(get_password_hash, password)
+
+
+def _base64url(data: bytes) -> bytes:
+    """Base64url-encode without padding, as required by JWS."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+@lru_cache(maxsize=4)
+def _hmac_signer(algorithm: str, secret_key: str) -> Optional[Tuple[bytes, hmac.HMAC]]:
+    """
+    Build the reusable signing state for an HMAC JWT algorithm.
+
+    The header segment is encoded once and the HMAC is keyed once and primed
+    with "<header>."; callers copy() it and feed only the payload segment.
+    Cached per (algorithm, key) so settings changes still take effect.
+
+    Args:
+        algorithm: JWT algorithm name (e.g., "HS256")
+        secret_key: Signing secret
+
+    Returns:
+        Tuple of (header segment, primed HMAC) or None for non-HMAC algorithms
+    """
+    digest = _HMAC_DIGESTS.get(algorithm)
+    if digest is None:
+        return None
+
+    # Same header encoding as PyJWT (sorted keys, compact separators)
+    header = json.dumps({"alg": algorithm, "typ": "JWT"}, separators=(",", ":"), sort_keys=True)
+    header_segment = _base64url(header.encode("utf-8"))
+
+    signer = hmac.new(secret_key.encode("utf-8"), digestmod=digest)
+    signer.update(header_segment + b".")
+    return header_segment, signer
+
+
+def _signing_key() -> str:
+    """Key used to sign tokens: the PEM private key for RS*/ES*/EdDSA, else the shared secret."""
+    if settings.JWT_ALGORITHM in _HMAC_DIGESTS:
+        return settings.JWT_SECRET_KEY
+    if not settings.JWT_PRIVATE_KEY:
+        raise ValueError(f"JWT_PRIVATE_KEY is required for {settings.JWT_ALGORITHM} tokens")
+    return settings.JWT_PRIVATE_KEY
+
+
+def _verification_key() -> str:
+    """Key used to verify tokens: the PEM public key for RS*/ES*/EdDSA, else the shared secret."""
+    if settings.JWT_ALGORITHM in _HMAC_DIGESTS:
+        return settings.JWT_SECRET_KEY
+    if not settings.JWT_PUBLIC_KEY:
+        raise ValueError(f"JWT_PUBLIC_KEY is required for {settings.JWT_ALGORITHM} tokens")
+    return settings.JWT_PUBLIC_KEY
+
+
+def _encode_token(payload: dict) -> str:
+    """
+    Encode and sign a JWT with the configured algorithm and key.
+
+    HMAC algorithms reuse the cached header and keyed HMAC state from
+    _hmac_signer; asymmetric algorithms (RS*/ES*/EdDSA) are signed by PyJWT
+    with JWT_PRIVATE_KEY. Tokens are byte-identical to jwt.encode output.
+
+    Args:
+        payload: JSON-serializable claims
+
+    Returns:
+        Encoded JWT token string
+    """
+    cached = _hmac_signer(settings.JWT_ALGORITHM, settings.JWT_SECRET_KEY)
+    if cached is None:
+        return jwt.encode(payload, _signing_key(), algorithm=settings.JWT_ALGORITHM)
+
+    header_segment, signer = cached
+    payload_segment = _base64url(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+
+    mac = signer.copy()
+    mac.update(payload_segment)
+
+    return b".".join(
+        (header_segment, payload_segment, _base64url(mac.digest()))
+    ).decode("ascii")
 
 
 def create_access_token(user_id: int, expires_delta: Optional[timedelta] = None) -> str:
@@ -51,9 +200,12 @@ def create_access_token(user_id: int, expires_delta: Optional[timedelta] = None)
         Encoded JWT token string
     """
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        lifetime_seconds = int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        lifetime_seconds = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+    # JWT "exp" is an integer Unix timestamp
+    expire = int(time.time()) + lifetime_seconds
 
     payload = {
         "sub": str(user_id),
@@ -61,7 +213,7 @@ def create_access_token(user_id: int, expires_delta: Optional[timedelta] = None)
         "type": "access"
     }
 
-    return jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+    return _encode_token(payload)
 
 
 def create_refresh_token(user_id: int, expires_delta: Optional[timedelta] = None) -> str:
@@ -76,9 +228,12 @@ def create_refresh_token(user_id: int, expires_delta: Optional[timedelta] = None
         Encoded JWT refresh token string
     """
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        lifetime_seconds = int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+        lifetime_seconds = settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400
+
+    # JWT "exp" is an integer Unix timestamp
+    expire = int(time.time()) + lifetime_seconds
 
     payload = {
         "sub": str(user_id),
@@ -86,49 +241,111 @@ def create_refresh_token(user_id: int, expires_delta: Optional[timedelta] = None
         "type": "refresh"
     }
 
-    return jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+    return _encode_token(payload)
 
 
 def verify_token(token: str, token_type: str = "access") -> Optional[TokenPayload]:
     """
     Verify and decode a JWT token.
 
+    Successfully verified tokens are cached for up to
+    TOKEN_CACHE_TTL_SECONDS (never past their own expiry), so a session
+    presenting the same bearer token on every request skips signature
+    verification and decoding after the first hit. Changing the
+    verification key or algorithm invalidates cached entries immediately.
+
     Args:
         token: JWT token string
         token_type: Expected token type ("access" or "refresh")
 
     Returns:
         TokenPayload if valid, None if invalid or expired
+    """
+    cache_key = hashlib.blake2b(
+        f"{token_type}:{token}".encode("utf-8"),
+        digest_size=16,
+        key=_key_fingerprint(settings.JWT_ALGORITHM, _verification_key()),
+    ).digest()
+    now = time.time()
+
+    with _token_cache_lock:
+        cached = _token_cache.get(cache_key)
+        if cached is not None:
+            cached_until, token_payload = cached
+            if now < cached_until:
+                _token_cache.move_to_end(cache_key)
+                return token_payload
+            del _token_cache[cache_key]
+
+    token_payload = _decode_token(token, token_type)
+
+    if token_payload is not None:
+        with _token_cache_lock:
+            _token_cache[cache_key] = (
+                min(token_payload.exp, now + TOKEN_CACHE_TTL_SECONDS),
+                token_payload,
+            )
+            if len(_token_cache) > TOKEN_CACHE_MAX_SIZE:
+                _token_cache.popitem(last=False)
+
+    return token_payload
+
+
+@lru_cache(maxsize=4)
+def _key_fingerprint(algorithm: str, verification_key: str) -> bytes:
+    """
+    Digest of the algorithm and key that verified a cached token.
+
+    Used as the blake2b key of token cache entries, so entries verified
+    under a previous key never match once the key changes.
+
+    Args:
+        algorithm: JWT algorithm name (e.g., "HS256")
+        verification_key: Shared secret or PEM public key
 
-    Raises:
-        JWTError: If token is malformed or signature is invalid
+    Returns:
+        32-byte digest
+    """
+    return hashlib.blake2b(
+        f"{algorithm}:{verification_key}".encode("utf-8"), digest_size=32
+    ).digest()
+
+
+def clear_token_cache() -> None:
+    """Drop all cached token verifications (e.g., after rotating keys)."""
+    with _token_cache_lock:
+        _token_cache.clear()
+
+
+def _decode_token(token: str, token_type: str) -> Optional[TokenPayload]:
+    """
+    Verify a JWT signature and claims without consulting the cache.
+
+    Args:
+        token: JWT token string
+        token_type: Expected token type ("access" or "refresh")
+
+    Returns:
+        TokenPayload if valid, None if invalid or expired
     """
     try:
-        payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
-
-        # Verify token type
-        if payload.get("type") != token_type:
-            return None
-
-        # Extract user ID
-        user_id = payload.get("sub")
-        if user_id is None:
-            return None
-
-        # Extract expiration
-        exp = payload.get("exp")
-        if exp is None:
-            return None
-
-        return TokenPayload(
-            sub=int(user_id),
-            exp=datetime.fromtimestamp(exp),
-            type=payload.get("type")
-        )
+        payload = jwt.decode(token, _verification_key(), algorithms=[settings.JWT_ALGORITHM])
+    except InvalidTokenError:
+        return None
 
-    except JWTError:
+    # Check type, subject and expiry claims in one pass
+    user_id = payload.get("sub")
+    exp = payload.get("exp")
+    if payload.get("type") != token_type or user_id is None or exp is None:
         return None
 
+    try:
+        user_id = int(user_id)
+    except (TypeError, ValueError):
+        return None
+
+    return TokenPayload(sub=user_id, exp=exp, type=token_type)
+
 
 def validate_password_strength(password: str) -> tuple[bool, str]:
     """
@@ -148,13 +365,28 @@ def validate_password_strength(password: str) -> tuple[bool, str]:
     if len(password) < 8:
         return False, "Password must be at least 8 characters long"
 
-    if not any(c.isupper() for c in password):
+    # Single pass over the password, stopping once every class is seen
+    has_upper = has_lower = has_digit = False
+    for c in password:
+        if c.isupper():
+            has_upper = True
+        elif c.islower():
+            has_lower = True
+        elif c.isdigit():
+            has_digit = True
+        else:
+            continue
+
+        if has_upper and has_lower and has_digit:
+            break
+
+    if not has_upper:
         return False, "Password must contain at least one uppercase letter"
 
-    if not any(c.islower() for c in password):
+    if not has_lower:
         return False, "Password must contain at least one lowercase letter"
 
-    if not any(c.isdigit() for c in password):
+    if not has_digit:
         return False, "Password must contain at least one number"
 
     return True, ""
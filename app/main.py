@@ -7,11 +7,13 @@ middleware for the enterprise-grade parcel analysis system.
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from datetime import datetime
+import re
 import time
 import logging
 
+import orjson
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
@@ -19,14 +21,24 @@ from app.api import analyze, rules, metadata, autocomplete, economic_feasibility
 from app.core.config import settings
 from app.core.rate_limit import limiter
 from app.core.database import create_db_and_tables
-from app.utils.logging import setup_logging, get_logger
+from app.utils.logging import setup_logging, get_logger, bind_log_context, reset_log_context
 
 # Setup logging
 setup_logging()
 logger = get_logger(__name__)
 
-# Initialize Sentry for error monitoring
-if settings.SENTRY_ENABLED and settings.SENTRY_DSN:
+def _init_sentry() -> None:
+    """
+    Initialize Sentry error monitoring when it is enabled.
+
+    sentry_sdk is only imported when monitoring is on. This must run before
+    the app and its routes are created: the FastAPI/Starlette integrations
+    wrap route handlers as routes are built, so a later init (e.g. in the
+    startup event) would leave every endpoint uninstrumented.
+    """
+    if not (settings.SENTRY_ENABLED and settings.SENTRY_DSN):
+        return
+
     import sentry_sdk
     from sentry_sdk.integrations.fastapi import FastApiIntegration
     from sentry_sdk.integrations.starlette import StarletteIntegration
@@ -51,6 +63,10 @@ if settings.SENTRY_ENABLED and settings.SENTRY_DSN:
         "traces_sample_rate": settings.SENTRY_TRACES_SAMPLE_RATE
     })
 
+
+# Initialize Sentry for error monitoring
+_init_sentry()
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     description=settings.DESCRIPTION,
@@ -58,6 +74,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse,
 )
 
 # Create database tables on startup
@@ -89,7 +106,7 @@ async def custom_rate_limit_handler(request: Request, exc: RateLimitExceeded):
         }
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=429,
         content={
             "error": "rate_limit_exceeded",
@@ -102,24 +119,24 @@ async def custom_rate_limit_handler(request: Request, exc: RateLimitExceeded):
         }
     )
 
+# Allowed CORS origins, resolved once at import (settings are fixed at startup)
+_EXACT_ORIGINS = frozenset(settings.BACKEND_CORS_ORIGINS)
+_WILDCARD_ORIGIN_PATTERNS = [
+    re.compile("^" + allowed_origin.replace('.', r'\.').replace('*', '.*') + "$")
+    for allowed_origin in settings.BACKEND_CORS_ORIGINS
+    if '*' in allowed_origin
+]
+
+
 # Custom CORS origin checker that supports wildcard patterns
 def is_allowed_origin(origin: str) -> bool:
     """Check if origin is allowed based on CORS settings."""
-    import re
-
     # Check exact matches first
-    if origin in settings.BACKEND_CORS_ORIGINS:
+    if origin in _EXACT_ORIGINS:
         return True
 
     # Check wildcard patterns
-    for allowed_origin in settings.BACKEND_CORS_ORIGINS:
-        if '*' in allowed_origin:
-            # Convert wildcard pattern to regex
-            pattern = allowed_origin.replace('.', r'\.').replace('*', '.*')
-            if re.match(f'^{pattern}$', origin):
-                return True
-
-    return False
+    return any(pattern.match(origin) for pattern in _WILDCARD_ORIGIN_PATTERNS)
 
 # CORS middleware with custom origin validation
 app.add_middleware(
@@ -136,34 +153,37 @@ app.add_middleware(
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     """Log all HTTP requests with timing information."""
-    start_time = time.time()
-
-    # Log request
-    logger.info(
-        "Request started",
-        extra={
-            "method": request.method,
-            "path": request.url.path,
-            "client_host": request.client.host if request.client else None,
-        }
+    # Skip all per-request bookkeeping when INFO records would be dropped.
+    # isEnabledFor is memoized by the logging module and reset on level changes.
+    if not logger.isEnabledFor(logging.INFO):
+        return await call_next(request)
+
+    start_ns = time.perf_counter_ns()
+
+    # Bind request fields once; every log record for this request carries them
+    context_token = bind_log_context(
+        method=request.method,
+        path=request.url.path,
+        client_host=request.client.host if request.client else None,
     )
+    try:
+        # Log request
+        logger.info("Request started")
 
-    # Process request
-    response = await call_next(request)
+        # Process request
+        response = await call_next(request)
 
-    # Calculate duration
-    duration = time.time() - start_time
+        # Calculate duration (monotonic clock)
+        duration_ms = round((time.perf_counter_ns() - start_ns) / 1_000_000, 2)
 
-    # Log response
-    logger.info(
-        "Request completed",
-        extra={
-            "method": request.method,
-            "path": request.url.path,
-            "status_code": response.status_code,
-            "duration_ms": round(duration * 1000, 2),
-        }
-    )
+        # Log response
+        bind_log_context(
+            status_code=response.status_code,
+            duration_ms=duration_ms,
+        )
+        logger.info("Request completed")
+    finally:
+        reset_log_context(context_token)
 
     return response
 
@@ -211,6 +231,36 @@ app.include_router(
 #         raise HTTPException(status_code=500, detail="Failed to query rent control database")
 
 
+# /health body, serialized once: every field except the timestamp is fixed
+# for the life of the process, so probes only splice in the current time.
+_HEALTH_TIMESTAMP_PLACEHOLDER = b'"__TIMESTAMP__"'
+_HEALTH_TEMPLATE = orjson.dumps({
+    "status": "healthy",
+    "timestamp": "__TIMESTAMP__",
+    "version": settings.VERSION,
+    "environment": settings.ENVIRONMENT,
+    "features": {
+        "ab2011": settings.ENABLE_AB2011,
+        "sb35": settings.ENABLE_SB35,
+        "density_bonus": settings.ENABLE_DENSITY_BONUS,
+        "sb9": settings.ENABLE_SB9,
+        "ab2097": settings.ENABLE_AB2097,
+    },
+    "services": {
+        "gis_services_configured": bool(settings.SANTA_MONICA_PARCEL_SERVICE_URL),
+        "narrative_generation": settings.ENABLE_NARRATIVE_GENERATION,
+        "database": settings.DATABASE_URL.split("@")[-1] if "@" in settings.DATABASE_URL else "configured",
+        "error_monitoring": settings.SENTRY_ENABLED,
+        "rate_limiting": settings.RATE_LIMIT_ENABLED,
+    }
+})
+
+# Most recent encoded /health timestamp and the monotonic time it was taken;
+# probes within the same second reuse it. Concurrent refreshes are harmless.
+_HEALTH_TIMESTAMP_CACHE = [float("-inf"), b""]
+_HEALTH_TIMESTAMP_TTL_SECONDS = 1.0
+
+
 @app.get("/health")
 async def health_check():
     """
@@ -219,26 +269,14 @@ async def health_check():
     Returns the health status of the API along with enabled features
     and configuration information.
     """
-    return {
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "version": settings.VERSION,
-        "environment": settings.ENVIRONMENT,
-        "features": {
-            "ab2011": settings.ENABLE_AB2011,
-            "sb35": settings.ENABLE_SB35,
-            "density_bonus": settings.ENABLE_DENSITY_BONUS,
-            "sb9": settings.ENABLE_SB9,
-            "ab2097": settings.ENABLE_AB2097,
-        },
-        "services": {
-            "gis_services_configured": bool(settings.SANTA_MONICA_PARCEL_SERVICE_URL),
-            "narrative_generation": settings.ENABLE_NARRATIVE_GENERATION,
-            "database": settings.DATABASE_URL.split("@")[-1] if "@" in settings.DATABASE_URL else "configured",
-            "error_monitoring": settings.SENTRY_ENABLED,
-            "rate_limiting": settings.RATE_LIMIT_ENABLED,
-        }
-    }
+    now = time.monotonic()
+    if now - _HEALTH_TIMESTAMP_CACHE[0] >= _HEALTH_TIMESTAMP_TTL_SECONDS:
+        _HEALTH_TIMESTAMP_CACHE[:] = [now, orjson.dumps(datetime.now().isoformat())]
+    timestamp = _HEALTH_TIMESTAMP_CACHE[1]
+    return Response(
+        content=_HEALTH_TEMPLATE.replace(_HEALTH_TIMESTAMP_PLACEHOLDER, timestamp, 1),
+        media_type="application/json",
+    )
 
 
 @app.get("/")
@@ -1,49 +1,122 @@
 """
 Pydantic models for the Parcel Feasibility Engine.
+
+Names are re-exported lazily (PEP 562): importing one submodule such as
+app.models.parcel does not load the economic, user and subscription models.
 """
-from app.models.parcel import ParcelBase, ParcelCreate, Parcel
-from app.models.analysis import (
-    AnalysisRequest,
-    AnalysisResponse,
-    DevelopmentScenario,
-    AnalysisSummary,
-    RentControlData,
-    RentControlUnit,
-)
-from app.models.economic_feasibility import (
-    EconomicAssumptions,
-    ConstructionInputs,
-    ConstructionCostEstimate,
-    RevenueInputs,
-    RevenueProjection,
-    TimelineInputs,
-    CashFlow,
-    FinancialMetrics,
-    SensitivityInput,
-    TornadoResult,
-    MonteCarloInputs,
-    MonteCarloResult,
-    SensitivityAnalysis,
-    FeasibilityAnalysis,
-    FeasibilityRequest,
-)
-from app.models.user import (
-    User,
-    UserCreate,
-    UserUpdate,
-    UserResponse,
-    Token,
-    TokenPayload,
-    LoginRequest,
-)
-from app.models.subscription import (
-    Subscription,
-    SubscriptionStatus,
-    SubscriptionPlan,
-    SubscriptionResponse,
-    APIUsage,
-    UsageStats,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from app.models.parcel import ParcelBase, ParcelCreate, Parcel
+    from app.models.analysis import (
+        AnalysisRequest,
+        AnalysisResponse,
+        DevelopmentScenario,
+        AnalysisSummary,
+        RentControlData,
+        RentControlUnit,
+    )
+    from app.models.economic_feasibility import (
+        EconomicAssumptions,
+        ConstructionInputs,
+        ConstructionCostEstimate,
+        RevenueInputs,
+        RevenueProjection,
+        TimelineInputs,
+        CashFlow,
+        FinancialMetrics,
+        SensitivityInput,
+        TornadoResult,
+        MonteCarloInputs,
+        MonteCarloResult,
+        SensitivityAnalysis,
+        FeasibilityAnalysis,
+        FeasibilityRequest,
+    )
+    from app.models.user import (
+        User,
+        UserCreate,
+        UserUpdate,
+        UserResponse,
+        Token,
+        TokenPayload,
+        LoginRequest,
+    )
+    from app.models.subscription import (
+        Subscription,
+        SubscriptionStatus,
+        SubscriptionPlan,
+        SubscriptionResponse,
+        APIUsage,
+        UsageStats,
+    )
+
+# Submodule that defines each re-exported name
+_EXPORTS: Dict[str, str] = {
+    name: f"app.models.{module}"
+    for module, names in {
+        "parcel": ("ParcelBase", "ParcelCreate", "Parcel"),
+        "analysis": (
+            "AnalysisRequest",
+            "AnalysisResponse",
+            "DevelopmentScenario",
+            "AnalysisSummary",
+            "RentControlData",
+            "RentControlUnit",
+        ),
+        "economic_feasibility": (
+            "EconomicAssumptions",
+            "ConstructionInputs",
+            "ConstructionCostEstimate",
+            "RevenueInputs",
+            "RevenueProjection",
+            "TimelineInputs",
+            "CashFlow",
+            "FinancialMetrics",
+            "SensitivityInput",
+            "TornadoResult",
+            "MonteCarloInputs",
+            "MonteCarloResult",
+            "SensitivityAnalysis",
+            "FeasibilityAnalysis",
+            "FeasibilityRequest",
+        ),
+        "user": (
+            "User",
+            "UserCreate",
+            "UserUpdate",
+            "UserResponse",
+            "Token",
+            "TokenPayload",
+            "LoginRequest",
+        ),
+        "subscription": (
+            "Subscription",
+            "SubscriptionStatus",
+            "SubscriptionPlan",
+            "SubscriptionResponse",
+            "APIUsage",
+            "UsageStats",
+        ),
+    }.items()
+    for name in names
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining ``name`` on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
+
 
 __all__ = [
     # Parcel models
@@ -136,11 +136,6 @@ class AnalysisResponse(BaseModel):
     # Debug information (only included when debug=True)
     debug: Optional[Dict[str, Any]] = Field(None, description="Debug information with decision trace")
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-
 
 class AnalysisSummary(BaseModel):
     """Summary model for quick analysis overview."""
@@ -10,7 +10,7 @@ References:
 - California Department of Housing and Community Development guidelines
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional, List, Dict, Any
 from datetime import datetime, date
 
@@ -28,6 +28,9 @@ class EconomicAssumptions(BaseModel):
     in California coastal markets (2025 baseline).
     """
 
+    # Immutable: scenario variants are derived with model_copy(update=...)
+    model_config = ConfigDict(frozen=True)
+
     # Discount rate and hurdle rate
     discount_rate: float = Field(
         0.12,
@@ -157,6 +160,8 @@ class EconomicAssumptions(BaseModel):
 class TimelineInputs(BaseModel):
     """Development timeline configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     predevelopment_months: int = Field(6, ge=0, description="Predevelopment duration")
     construction_months: int = Field(18, ge=6, description="Construction duration")
     lease_up_months: int = Field(6, ge=0, description="Lease-up duration")
@@ -166,6 +171,8 @@ class TimelineInputs(BaseModel):
 class SensitivityVariable(BaseModel):
     """Configuration for sensitivity analysis variable."""
 
+    model_config = ConfigDict(frozen=True)
+
     variable_name: str = Field(..., description="Parameter name (e.g., 'cost_per_sf')")
     label: str = Field(..., description="Display label (e.g., 'Construction Cost per SF')")
     delta_pct: float = Field(
@@ -179,6 +186,8 @@ class SensitivityVariable(BaseModel):
 class MonteCarloConfig(BaseModel):
     """Configuration for Monte Carlo simulation."""
 
+    model_config = ConfigDict(frozen=True)
+
     iterations: int = Field(
         10000,
         ge=100,
@@ -509,12 +518,6 @@ class FeasibilityAnalysis(BaseModel):
         description="Analysis timestamp"
     )
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-            date: lambda v: v.isoformat()
-        }
-
 
 # ============================================================================
 # Settings Model
@@ -545,5 +548,4 @@ class EconomicFeasibilitySettings(BaseModel):
     # Common area factor
     common_area_factor: float = Field(1.15, description="Common area multiplier (1.15 = 15% extra)")
 
-    class Config:
-        frozen = True  # Immutable
+    model_config = ConfigDict(frozen=True)  # Immutable
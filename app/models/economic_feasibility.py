@@ -13,11 +13,13 @@ References:
 - California Prop 13 tax rate limits (1%)
 - HCD income limits (AMI-based affordable rents)
 """
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, Field, ConfigDict
+from typing import Annotated, Optional, List, Dict, Any, Literal
 from datetime import datetime
 from fastapi import HTTPException
 
+from app.models.economic import CashFlowPeriod
+
 
 # ==============================================================================
 # Input Models - Economic Assumptions
@@ -185,8 +187,11 @@ class EconomicAssumptions(BaseModel):
         description="Data source references for transparency and audit trail"
     )
 
-    class Config:
-        json_schema_extra = {
+    # Immutable: scenario variants are derived with model_copy(update=...).
+    # Not hashable, since data_sources is a dict.
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "discount_rate": 0.12,
                 "risk_free_rate": 0.035,
@@ -205,7 +210,8 @@ class EconomicAssumptions(BaseModel):
                     "cap_rate": "CBRE Q1 2025 LA multifamily cap rates (4.5%)"
                 }
             }
-        }
+        },
+    )
 
 
 # ==============================================================================
@@ -232,7 +238,7 @@ class ConstructionInputs(BaseModel):
         description="Number of residential units"
     )
 
-    construction_type: str = Field(
+    construction_type: Literal["wood_frame", "concrete", "steel"] = Field(
         default="wood_frame",
         description=(
             "Construction type for cost estimation. "
@@ -283,17 +289,8 @@ class ConstructionInputs(BaseModel):
         )
     )
 
-    @field_validator("construction_type")
-    @classmethod
-    def validate_construction_type(cls, v: str) -> str:
-        """Validate construction type is recognized."""
-        valid_types = {"wood_frame", "concrete", "steel"}
-        if v not in valid_types:
-            raise ValueError(f"construction_type must be one of {valid_types}")
-        return v
-
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "total_buildable_sf": 25000.0,
                 "num_units": 30,
@@ -304,7 +301,8 @@ class ConstructionInputs(BaseModel):
                 "permit_fees_per_unit": 25000.0,
                 "use_wage_adjustment": True
             }
-        }
+        },
+    )
 
 
 class ConstructionCostEstimate(BaseModel):
@@ -348,8 +346,8 @@ class ConstructionCostEstimate(BaseModel):
         )
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "hard_costs": 6000000.0,
                 "soft_costs": 1500000.0,
@@ -374,7 +372,8 @@ class ConstructionCostEstimate(BaseModel):
                     "date": "2025-01-15"
                 }
             }
-        }
+        },
+    )
 
 
 # ==============================================================================
@@ -391,6 +390,8 @@ class RevenueInputs(BaseModel):
 
     parcel_zip: str = Field(
         ...,
+        min_length=5,
+        max_length=5,
         pattern=r"^\d{5}$",
         description="5-digit ZIP code for SAFMR lookup"
     )
@@ -412,11 +413,11 @@ class RevenueInputs(BaseModel):
         description="Number of affordable units"
     )
 
-    unit_mix: Dict[int, int] = Field(
+    unit_mix: Dict[Annotated[int, Field(ge=0, le=5)], int] = Field(
         ...,
         description=(
             "Unit mix by bedroom count. "
-            "Keys: bedrooms (0=studio, 1, 2, 3, 4), Values: unit count. "
+            "Keys: bedrooms (0=studio, 1-5), Values: unit count. "
             "Example: {0: 5, 1: 15, 2: 10} = 5 studios, 15 1BR, 10 2BR"
         )
     )
@@ -441,17 +442,8 @@ class RevenueInputs(BaseModel):
         )
     )
 
-    @field_validator("unit_mix")
-    @classmethod
-    def validate_unit_mix(cls, v: Dict[int, int]) -> Dict[int, int]:
-        """Validate unit mix has valid bedroom counts."""
-        for bedrooms in v.keys():
-            if bedrooms < 0 or bedrooms > 5:
-                raise ValueError(f"Bedroom count must be 0-5, got {bedrooms}")
-        return v
-
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "parcel_zip": "90401",
                 "county": "Los Angeles",
@@ -466,7 +458,8 @@ class RevenueInputs(BaseModel):
                 "use_safmr": True,
                 "quality_factor": 1.1
             }
-        }
+        },
+    )
 
 
 class RevenueProjection(BaseModel):
@@ -524,8 +517,8 @@ class RevenueProjection(BaseModel):
         )
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "annual_gross_income": 900000.0,
                 "vacancy_loss": 63000.0,
@@ -558,7 +551,8 @@ class RevenueProjection(BaseModel):
                     "date": "2025-01-15"
                 }
             }
-        }
+        },
+    )
 
 
 # ==============================================================================
@@ -597,22 +591,23 @@ class TimelineInputs(BaseModel):
         description="Operating period for cash flow projection (default 10 years for exit)"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "predevelopment_months": 12,
                 "construction_months": 18,
                 "lease_up_months": 6,
                 "operating_years": 10
             }
-        }
+        },
+    )
 
 
 class CashFlow(BaseModel):
     """Period-by-period cash flow."""
 
     period: int = Field(..., description="Period number (0 = start)")
-    period_type: str = Field(
+    period_type: Literal["predevelopment", "construction", "lease_up", "operations"] = Field(
         ...,
         description="Period type: 'predevelopment', 'construction', 'lease_up', 'operations'"
     )
@@ -624,14 +619,30 @@ class CashFlow(BaseModel):
     net_cash_flow: float = Field(..., description="Net cash flow (revenue - opex - capex)")
     cumulative_cash_flow: float = Field(..., description="Cumulative cash flow from period 0")
 
-    @field_validator("period_type")
-    @classmethod
-    def validate_period_type(cls, v: str) -> str:
-        """Validate period type."""
-        valid_types = {"predevelopment", "construction", "lease_up", "operations"}
-        if v not in valid_types:
-            raise ValueError(f"period_type must be one of {valid_types}")
-        return v
+
+class CashFlowSeries(BaseModel):
+    """Period-by-period cash flows stored column-wise, one list per field."""
+
+    period: List[int] = Field(..., description="Period numbers (0 = initial, 1 = year 1, etc.)")
+    description: List[str] = Field(..., description="Period descriptions")
+    amount: List[float] = Field(..., description="Cash flow amounts (+ inflow, - outflow)")
+    cumulative: List[float] = Field(..., description="Cumulative cash flow to date")
+    phase: List[str] = Field(..., description="Development phase of each period")
+
+    def to_periods(self) -> List[CashFlowPeriod]:
+        """Rebuild one CashFlowPeriod per period (row-wise layout)."""
+        return [
+            CashFlowPeriod(
+                period=period,
+                description=description,
+                amount=amount,
+                cumulative=cumulative,
+                phase=phase
+            )
+            for period, description, amount, cumulative, phase in zip(
+                self.period, self.description, self.amount, self.cumulative, self.phase
+            )
+        ]
 
 
 # ==============================================================================
@@ -706,8 +717,8 @@ class FinancialMetrics(BaseModel):
         description="Complete cash flow schedule by period"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "npv": 2500000.0,
                 "irr": 0.18,
@@ -727,7 +738,8 @@ class FinancialMetrics(BaseModel):
                     }
                 ]
             }
-        }
+        },
+    )
 
 
 # ==============================================================================
@@ -759,14 +771,15 @@ class SensitivityInput(BaseModel):
         )
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "variable_name": "cost_per_sf",
                 "base_value": 300.0,
                 "delta_percent": 0.20
             }
-        }
+        },
+    )
 
 
 class TornadoResult(BaseModel):
@@ -784,15 +797,16 @@ class TornadoResult(BaseModel):
         )
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "variable": "cost_per_sf",
                 "downside_npv": 3500000.0,
                 "upside_npv": 1500000.0,
                 "impact": 2000000.0
             }
-        }
+        },
+    )
 
 
 class MonteCarloInputs(BaseModel):
@@ -845,8 +859,8 @@ class MonteCarloInputs(BaseModel):
         description="Random seed for reproducible testing"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "iterations": 10000,
                 "cost_per_sf_std": 30.0,
@@ -858,7 +872,8 @@ class MonteCarloInputs(BaseModel):
                 "delay_months_std": 3.0,
                 "random_seed": 42
             }
-        }
+        },
+    )
 
 
 class MonteCarloResult(BaseModel):
@@ -895,8 +910,8 @@ class MonteCarloResult(BaseModel):
         description="Histogram counts per bin"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "probability_npv_positive": 0.87,
                 "mean_npv": 2300000.0,
@@ -911,7 +926,8 @@ class MonteCarloResult(BaseModel):
                 "histogram_bins": [-1000000.0, 0.0, 1000000.0, 2000000.0, 3000000.0, 4000000.0],
                 "histogram_counts": [130, 1200, 3500, 3800, 1370]
             }
-        }
+        },
+    )
 
 
 class SensitivityAnalysis(BaseModel):
@@ -995,12 +1011,8 @@ class FeasibilityAnalysis(BaseModel):
         description="Analysis timestamp"
     )
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "scenario_name": "SB 9 Lot Split + Density Bonus",
                 "parcel_apn": "4293-021-012",
@@ -1033,7 +1045,8 @@ class FeasibilityAnalysis(BaseModel):
                 },
                 "analysis_timestamp": "2025-01-15T10:30:00"
             }
-        }
+        },
+    )
 
 
 class FeasibilityRequest(BaseModel):
@@ -1076,8 +1089,8 @@ class FeasibilityRequest(BaseModel):
         description="Run Monte Carlo simulation"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "parcel_apn": "4293-021-012",
                 "scenario_name": "SB 9 Lot Split + Density Bonus",
@@ -1096,7 +1109,8 @@ class FeasibilityRequest(BaseModel):
                 "run_sensitivity": True,
                 "run_monte_carlo": True
             }
-        }
+        },
+    )
 
 
 # ==============================================================================
@@ -3,7 +3,7 @@ Financial analysis models.
 
 Models for construction cost estimation, economic assumptions, and financial inputs.
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional, Dict, Literal
 
 
@@ -25,8 +25,8 @@ class ConstructionInputs(BaseModel):
         18, gt=0, description="Expected construction duration in months"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "buildable_sqft": 10000.0,
                 "num_units": 10,
@@ -35,7 +35,8 @@ class ConstructionInputs(BaseModel):
                 "permit_fees_per_unit": 5000.0,
                 "construction_duration_months": 18,
             }
-        }
+        },
+    )
 
 
 class EconomicAssumptions(BaseModel):
@@ -63,8 +64,8 @@ class EconomicAssumptions(BaseModel):
         None, ge=0, description="Construction loan spread over 10Y Treasury (default 2.5%)"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "use_wage_adjustment": False,
                 "use_ccci": False,
@@ -74,7 +75,8 @@ class EconomicAssumptions(BaseModel):
                 "contingency_pct": 0.12,
                 "construction_loan_spread": 0.025,
             }
-        }
+        },
+    )
 
 
 class HardCostBreakdown(BaseModel):
@@ -120,8 +122,8 @@ class ConstructionCostEstimate(BaseModel):
     # Source notes for transparency
     source_notes: Dict[str, str] = Field(..., description="Data source notes with dates/references")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "total_cost": 4500000.0,
                 "cost_per_unit": 450000.0,
@@ -152,4 +154,5 @@ class ConstructionCostEstimate(BaseModel):
                     "location_factor": "2.3 (user input, RAND CA avg 2.3x)",
                 },
             }
-        }
+        },
+    )
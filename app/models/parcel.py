@@ -1,7 +1,7 @@
 """
 Parcel data models.
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional, List
 
 
@@ -175,5 +175,4 @@ class Parcel(ParcelBase):
 
     id: int = Field(..., description="Database ID")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -1,12 +1,44 @@
 """Parcel cache model for fast autocomplete lookups."""
+import logging
+
+from sqlalchemy import Index, event, text
+from sqlalchemy.exc import DBAPIError
 from sqlmodel import SQLModel, Field
 from typing import Optional
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
+
+def _pg_trgm_installed(ddl, target, bind, **kw) -> bool:
+    """Emit the trigram indexes only where the pg_trgm extension exists."""
+    if bind is None:
+        # DDL compiled without a connection
+        return True
+    return bind.execute(
+        text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+    ).first() is not None
+
 
 class ParcelCache(SQLModel, table=True):
     """Cached Santa Monica parcel data for quick lookups."""
     __tablename__ = "parcel_cache"
+    __table_args__ = (
+        # Trigram indexes serve the autocomplete ILIKE prefix/substring
+        # search on PostgreSQL (B-tree indexes cannot be used for ILIKE)
+        Index(
+            "ix_parcel_cache_apn_trgm",
+            "apn",
+            postgresql_using="gin",
+            postgresql_ops={"apn": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql", callable_=_pg_trgm_installed),
+        Index(
+            "ix_parcel_cache_address_trgm",
+            "address",
+            postgresql_using="gin",
+            postgresql_ops={"address": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql", callable_=_pg_trgm_installed),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     apn: str = Field(index=True, unique=True)
@@ -20,3 +52,27 @@ class ParcelCache(SQLModel, table=True):
     existing_units: Optional[int] = None
     geometry_wkt: Optional[str] = None  # WKT format for parcel boundary
     last_updated: datetime = Field(default_factory=datetime.utcnow)
+
+
+@event.listens_for(ParcelCache.__table__, "before_create")
+def _enable_pg_trgm(target, connection, **kw) -> None:
+    """
+    Enable pg_trgm (needed by gin_trgm_ops) before creating parcel_cache.
+
+    Managed PostgreSQL roles often lack the privilege to create extensions.
+    The attempt runs in a savepoint so a refusal does not abort create_all
+    at startup; the table is then created without the trigram indexes and
+    autocomplete falls back to sequential scans until a database owner
+    runs CREATE EXTENSION pg_trgm.
+    """
+    if connection.dialect.name != "postgresql":
+        return
+
+    try:
+        with connection.begin_nested():
+            connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    except DBAPIError as e:
+        logger.warning(
+            f"Could not enable pg_trgm ({e.orig}); "
+            "creating parcel_cache without trigram indexes"
+        )
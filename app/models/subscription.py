@@ -96,3 +96,8 @@ class UsageStats(SQLModel):
     total_analyses: int = Field(description="Total analyses run")
     analyses_this_month: int = Field(description="Analyses run this billing period")
     last_analysis: Optional[datetime] = Field(default=None, description="Last analysis timestamp")
+
+
+# Relationship target "User" is resolved by name through the SQLModel
+# registry, so it must be imported with this module
+from app.models.user import User  # noqa: E402
@@ -3,8 +3,7 @@ User models for authentication and authorization.
 """
 from sqlmodel import SQLModel, Field, Relationship
 from typing import Optional, List
-from datetime import datetime
-from pydantic import EmailStr
+from datetime import datetime, timezone
 
 
 class UserBase(SQLModel):
@@ -64,11 +63,21 @@ class Token(SQLModel):
 class TokenPayload(SQLModel):
     """JWT token payload model."""
     sub: int = Field(description="User ID (subject)")
-    exp: datetime = Field(description="Token expiration timestamp")
+    exp: int = Field(description="Token expiration (Unix timestamp, seconds)")
     type: str = Field(description="Token type (access or refresh)")
 
+    @property
+    def expires_at(self) -> datetime:
+        """Token expiration as a UTC datetime."""
+        return datetime.fromtimestamp(self.exp, tz=timezone.utc)
+
 
 class LoginRequest(SQLModel):
     """Login request model."""
     email: str = Field(description="User email")
     password: str = Field(description="User password")
+
+
+# Relationship targets ("Subscription", "APIUsage") are resolved by name
+# through the SQLModel registry, so they must be imported with this module
+from app.models.subscription import Subscription, APIUsage  # noqa: E402
@@ -1,7 +1,7 @@
 """
 Zoning regulation models.
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional
 
 
@@ -47,8 +47,7 @@ class Zoning(ZoningBase):
 
     id: int = Field(..., description="Database ID")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ZoningOverlay(BaseModel):
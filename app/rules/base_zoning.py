@@ -4,7 +4,65 @@ Base zoning analysis rules.
 from app.models.analysis import DevelopmentScenario
 from app.models.parcel import ParcelBase
 from app.rules.tiered_standards import compute_max_far, compute_max_height, get_tier_info
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, NamedTuple, Optional, Tuple
+
+
+class _ZoningStandards(NamedTuple):
+    """Base development standards for a zoning district."""
+    density_per_acre: Optional[float]  # None = single unit regardless of lot size
+    min_units: int
+    max_far: float
+    max_height_ft: float
+    max_stories: int
+    lot_coverage_pct: float
+    parking_per_unit: float
+
+
+# Single-family standards, also used when no rule matches the zoning code
+_SINGLE_FAMILY = _ZoningStandards(None, 1, 0.5, 35.0, 2, 40.0, 2.0)
+
+# Zoning code substrings -> standards, checked in order (first match wins)
+_ZONING_RULES: Tuple[Tuple[Tuple[str, ...], _ZoningStandards], ...] = (
+    # Single-family residential
+    (("R1", "RS"), _SINGLE_FAMILY),
+    # Low-density multi-family
+    (("R2", "RD"), _ZoningStandards(15.0, 2, 0.75, 40.0, 3, 50.0, 1.5)),
+    # Medium-density multi-family
+    (("R3", "RM"), _ZoningStandards(30.0, 0, 1.5, 55.0, 4, 60.0, 1.5)),
+    # High-density multi-family
+    (("R4", "RH"), _ZoningStandards(60.0, 0, 2.5, 75.0, 6, 70.0, 1.0)),
+    # Commercial - assume mixed-use allowed
+    (("C", "COMMERCIAL"), _ZoningStandards(40.0, 0, 2.0, 65.0, 5, 80.0, 1.0)),
+    # Mixed-use zones (MUBL, MUBM, MUBH, MUB, MUCR, NV - Neighborhood Village,
+    # WT - Wilshire Transition)
+    # Neighborhood Village - moderate density mixed-use
+    (("NV",), _ZoningStandards(25.0, 1, 1.0, 35.0, 2, 60.0, 1.0)),
+    # Wilshire Transition - mixed-use transition zone
+    # TODO(SM): Confirm actual WT standards from municipal code
+    (("WT",), _ZoningStandards(35.0, 1, 1.75, 50.0, 4, 65.0, 1.0)),
+    # Mixed-Use Boulevard Low
+    (("MUBL",), _ZoningStandards(30.0, 1, 1.5, 45.0, 3, 65.0, 1.0)),
+    # Mixed-Use Boulevard Medium
+    (("MUBM",), _ZoningStandards(50.0, 1, 2.0, 55.0, 4, 70.0, 1.0)),
+    # Mixed-Use Boulevard High
+    (("MUBH",), _ZoningStandards(75.0, 1, 3.0, 84.0, 7, 75.0, 0.75)),
+    # Generic mixed-use
+    (("MU", "MIXED"), _ZoningStandards(40.0, 1, 2.0, 65.0, 5, 70.0, 1.0)),
+)
+
+
+@lru_cache(maxsize=256)
+def _zoning_standards(zoning_code: str) -> _ZoningStandards:
+    """
+    Look up base standards for an upper-cased zoning code.
+
+    This is simplified - real implementation would query zoning database.
+    """
+    for keys, standards in _ZONING_RULES:
+        if any(key in zoning_code for key in keys):
+            return standards
+    return _SINGLE_FAMILY
 
 
 def analyze_base_zoning(parcel: ParcelBase) -> DevelopmentScenario:
@@ -20,127 +78,26 @@ def analyze_base_zoning(parcel: ParcelBase) -> DevelopmentScenario:
     Returns:
         Development scenario under base zoning
     """
-    # Parse zoning code to determine development standards
-    # This is simplified - real implementation would query zoning database
-
-    zoning_code = parcel.zoning_code.upper()
-
-    # Initialize default values
-    max_units = 1
-    max_far = 0.5
-    max_height_ft = 35.0
-    max_stories = 2
-    lot_coverage_pct = 40.0
-    parking_per_unit = 2.0
+    # Resolve development standards from the zoning code (cached per code)
+    standards = _zoning_standards(parcel.zoning_code.upper())
+    max_far = standards.max_far
+    max_height_ft = standards.max_height_ft
+    max_stories = standards.max_stories
+    lot_coverage_pct = standards.lot_coverage_pct
+    parking_per_unit = standards.parking_per_unit
+
+    if standards.density_per_acre is None:
+        max_units = 1
+    else:
+        max_units = max(
+            int((parcel.lot_size_sqft / 43560) * standards.density_per_acre),
+            standards.min_units
+        )
 
     front_setback = 20.0
     rear_setback = 15.0
     side_setback = 5.0
 
-    # Determine zoning parameters based on code
-    if "R1" in zoning_code or "RS" in zoning_code:
-        # Single-family residential
-        max_units = 1
-        max_far = 0.5
-        max_height_ft = 35.0
-        max_stories = 2
-        lot_coverage_pct = 40.0
-        parking_per_unit = 2.0
-
-    elif "R2" in zoning_code or "RD" in zoning_code:
-        # Low-density multi-family
-        density_per_acre = 15.0
-        max_units = max(int((parcel.lot_size_sqft / 43560) * density_per_acre), 2)
-        max_far = 0.75
-        max_height_ft = 40.0
-        max_stories = 3
-        lot_coverage_pct = 50.0
-        parking_per_unit = 1.5
-
-    elif "R3" in zoning_code or "RM" in zoning_code:
-        # Medium-density multi-family
-        density_per_acre = 30.0
-        max_units = int((parcel.lot_size_sqft / 43560) * density_per_acre)
-        max_far = 1.5
-        max_height_ft = 55.0
-        max_stories = 4
-        lot_coverage_pct = 60.0
-        parking_per_unit = 1.5
-
-    elif "R4" in zoning_code or "RH" in zoning_code:
-        # High-density multi-family
-        density_per_acre = 60.0
-        max_units = int((parcel.lot_size_sqft / 43560) * density_per_acre)
-        max_far = 2.5
-        max_height_ft = 75.0
-        max_stories = 6
-        lot_coverage_pct = 70.0
-        parking_per_unit = 1.0
-
-    elif "C" in zoning_code or "COMMERCIAL" in zoning_code:
-        # Commercial - assume mixed-use allowed
-        density_per_acre = 40.0
-        max_units = int((parcel.lot_size_sqft / 43560) * density_per_acre)
-        max_far = 2.0
-        max_height_ft = 65.0
-        max_stories = 5
-        lot_coverage_pct = 80.0
-        parking_per_unit = 1.0
-
-    elif "MU" in zoning_code or "MIXED" in zoning_code or "NV" in zoning_code or "WT" in zoning_code:
-        # Mixed-use zones (MUBL, MUBM, MUBH, MUB, MUCR, NV - Neighborhood Village, WT - Wilshire Transition)
-        if "NV" in zoning_code:
-            # Neighborhood Village - moderate density mixed-use
-            density_per_acre = 25.0
-            max_far = 1.0
-            max_height_ft = 35.0
-            max_stories = 2
-            lot_coverage_pct = 60.0
-            parking_per_unit = 1.0
-        elif "WT" in zoning_code:
-            # Wilshire Transition - mixed-use transition zone
-            # TODO(SM): Confirm actual WT standards from municipal code
-            density_per_acre = 35.0
-            max_far = 1.75
-            max_height_ft = 50.0
-            max_stories = 4
-            lot_coverage_pct = 65.0
-            parking_per_unit = 1.0
-        elif "MUBL" in zoning_code:
-            # Mixed-Use Boulevard Low
-            density_per_acre = 30.0
-            max_far = 1.5
-            max_height_ft = 45.0
-            max_stories = 3
-            lot_coverage_pct = 65.0
-            parking_per_unit = 1.0
-        elif "MUBM" in zoning_code:
-            # Mixed-Use Boulevard Medium
-            density_per_acre = 50.0
-            max_far = 2.0
-            max_height_ft = 55.0
-            max_stories = 4
-            lot_coverage_pct = 70.0
-            parking_per_unit = 1.0
-        elif "MUBH" in zoning_code:
-            # Mixed-Use Boulevard High
-            density_per_acre = 75.0
-            max_far = 3.0
-            max_height_ft = 84.0
-            max_stories = 7
-            lot_coverage_pct = 75.0
-            parking_per_unit = 0.75
-        else:
-            # Generic mixed-use
-            density_per_acre = 40.0
-            max_far = 2.0
-            max_height_ft = 65.0
-            max_stories = 5
-            lot_coverage_pct = 70.0
-            parking_per_unit = 1.0
-
-        max_units = max(int((parcel.lot_size_sqft / 43560) * density_per_acre), 1)
-
     # Apply tier-aware FAR and height (considers overlays and tiers)
     tiered_far, far_source = compute_max_far(parcel)
     tiered_height, height_source = compute_max_height(parcel)
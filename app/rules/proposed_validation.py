@@ -272,9 +272,9 @@ def format_warnings_for_response(warnings: List[ValidationWarning]) -> Dict[str,
     return {
         "is_valid": len(errors) == 0,
         "total_issues": len(warnings),
-        "errors": [w.dict() for w in errors],
-        "warnings": [w.dict() for w in warnings_list],
-        "info": [w.dict() for w in info],
+        "errors": [w.model_dump() for w in errors],
+        "warnings": [w.model_dump() for w in warnings_list],
+        "info": [w.model_dump() for w in info],
         "summary": {
             "error_count": len(errors),
             "warning_count": len(warnings_list),
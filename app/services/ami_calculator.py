@@ -23,7 +23,7 @@ References:
 - HUD Fair Market Rent methodology
 """
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, ConfigDict
 from typing import Optional, List, Dict
 import pandas as pd
 from pathlib import Path
@@ -38,15 +38,16 @@ class AMILookup(BaseModel):
     household_size: int = Field(..., ge=1, le=8, description="Household size (1-8 persons)")
     income_limit: float = Field(..., description="Annual income limit in dollars")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "county": "Los Angeles",
                 "ami_pct": 50.0,
                 "household_size": 2,
                 "income_limit": 42640.0
             }
-        }
+        },
+    )
 
 
 class AffordableRent(BaseModel):
@@ -61,8 +62,8 @@ class AffordableRent(BaseModel):
     max_rent_no_utilities: float = Field(..., description="Max monthly rent without utilities")
     utility_allowance: float = Field(default=150.0, description="Monthly utility allowance")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "county": "Los Angeles",
                 "ami_pct": 50.0,
@@ -73,7 +74,8 @@ class AffordableRent(BaseModel):
                 "max_rent_no_utilities": 1049.25,
                 "utility_allowance": 150.0
             }
-        }
+        },
+    )
 
 
 class AffordableSalesPrice(BaseModel):
@@ -86,8 +88,8 @@ class AffordableSalesPrice(BaseModel):
     max_sales_price: float = Field(..., description="Maximum affordable sales price")
     assumptions: Dict[str, float] = Field(..., description="Calculation assumptions")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "county": "Los Angeles",
                 "ami_pct": 80.0,
@@ -103,7 +105,8 @@ class AffordableSalesPrice(BaseModel):
                     "hoa_monthly": 0.0
                 }
             }
-        }
+        },
+    )
 
 
 class AMICalculator:
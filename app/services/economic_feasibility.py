@@ -27,11 +27,13 @@ from app.core.financial_math import (
     calculate_profitability_index,
     calculate_tornado_sensitivity,
     run_monte_carlo_simulation,
-    generate_development_cash_flows,
+    generate_development_cash_flow_amounts,
+    generate_development_cash_flow_columns,
+    calculate_development_present_values,
     calculate_exit_value,
     SensitivityInput,
     MonteCarloInputs,
-    TimelineInputs,
+    TimelineInputs as CashFlowTimeline,
     CashFlow,
     TornadoResult,
     MonteCarloResult,
@@ -48,8 +50,8 @@ from app.models.economic_feasibility import (
     ConstructionInputs,
     ConstructionCostEstimate,
     RevenueProjection,
-    TimelineInputs,
-    RevenueInputs
+    RevenueInputs,
+    CashFlowSeries
 )
 
 from app.services.cost_estimator import estimate_construction_cost
@@ -58,8 +60,11 @@ from app.services.ami_calculator import AMICalculator, get_ami_calculator
 
 from typing import Dict, Any, List, Optional, Callable
 from datetime import datetime
+from functools import partial
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -146,7 +151,9 @@ def _create_npv_function(
     """
     Create NPV calculation function for sensitivity analysis.
 
-    Returns a function that takes parameter overrides and returns NPV.
+    Returns a function that takes parameter overrides and returns NPV. The
+    function is a functools.partial over a module-level function so it can be
+    pickled into Monte Carlo worker processes.
 
     Args:
         base_params: Base case parameters (includes assumptions)
@@ -157,63 +164,148 @@ def _create_npv_function(
     Returns:
         Function that calculates NPV given parameters
     """
-    def calculate_scenario_npv(params: Dict[str, Any]) -> float:
-        """Calculate NPV for a given parameter set."""
-        # Extract assumptions from params
-        assumptions = params.get('assumptions', base_params['assumptions'])
-
-        # Calculate costs
-        cost_per_sf = params.get('cost_per_sf', base_params['cost_per_sf'])
-        quality_factor = params.get('quality_factor', base_params.get('quality_factor', 1.0))
-        total_cost = buildable_sf * cost_per_sf * quality_factor
-
-        # Calculate revenue (NOI)
-        rent_per_sf = params.get('avg_rent_per_sf_month', assumptions.avg_rent_per_sf_month)
-
-        # Create modified assumptions
-        modified_assumptions = EconomicAssumptions(**assumptions.model_dump())
-        modified_assumptions.avg_rent_per_sf_month = rent_per_sf
-        modified_assumptions.exit_cap_rate = params.get('exit_cap_rate', assumptions.exit_cap_rate)
-        modified_assumptions.rent_growth_rate = params.get('rent_growth_rate', assumptions.rent_growth_rate)
-
-        # Calculate NOI
-        annual_noi = _estimate_revenue_simple(
-            num_units, buildable_sf, modified_assumptions, affordable_pct
-        )
+    return partial(
+        _calculate_scenario_npv,
+        base_params=base_params,
+        num_units=num_units,
+        buildable_sf=buildable_sf,
+        affordable_pct=affordable_pct
+    )
 
-        # Adjust for construction delay
-        construction_delay_months = params.get('construction_delay_months', 0)
-        construction_months = assumptions.construction_months + construction_delay_months
 
-        # Generate cash flows
-        timeline = TimelineInputs(
-            predevelopment_months=assumptions.predevelopment_months,
-            construction_months=int(construction_months),
-            lease_up_months=assumptions.lease_up_months,
-            operations_years=assumptions.holding_period_years
-        )
+def _calculate_scenario_npv(
+    params: Dict[str, Any],
+    base_params: Dict[str, Any],
+    num_units: int,
+    buildable_sf: float,
+    affordable_pct: float
+) -> float:
+    """Calculate NPV for a given parameter set."""
+    # Extract assumptions from params
+    assumptions = params.get('assumptions', base_params['assumptions'])
+
+    # Calculate costs
+    cost_per_sf = params.get('cost_per_sf', base_params['cost_per_sf'])
+    quality_factor = params.get('quality_factor', base_params.get('quality_factor', 1.0))
+    total_cost = buildable_sf * cost_per_sf * quality_factor
+
+    # Calculate revenue (NOI)
+    rent_per_sf = params.get('avg_rent_per_sf_month', assumptions.avg_rent_per_sf_month)
+
+    # Create modified assumptions (model_copy skips re-validating every field)
+    modified_assumptions = assumptions.model_copy(update={
+        'avg_rent_per_sf_month': rent_per_sf,
+        'exit_cap_rate': params.get('exit_cap_rate', assumptions.exit_cap_rate),
+        'rent_growth_rate': params.get('rent_growth_rate', assumptions.rent_growth_rate),
+    })
+
+    # Calculate NOI
+    annual_noi = _estimate_revenue_simple(
+        num_units, buildable_sf, modified_assumptions, affordable_pct
+    )
 
-        cash_flows_data = generate_development_cash_flows(
-            total_construction_cost=total_cost,
-            annual_noi=annual_noi,
-            timeline=timeline,
-            exit_cap_rate=modified_assumptions.exit_cap_rate,
-            soft_cost_pct=assumptions.soft_cost_pct
-        )
+    # Adjust for construction delay
+    construction_delay_months = params.get('construction_delay_months', 0)
+    construction_months = assumptions.construction_months + construction_delay_months
+
+    # Generate cash flows
+    timeline = CashFlowTimeline(
+        predevelopment_months=assumptions.predevelopment_months,
+        construction_months=int(construction_months),
+        lease_up_months=assumptions.lease_up_months,
+        operations_years=assumptions.holding_period_years
+    )
+
+    # Cash flow amounts only (skip period 0 which is initial investment)
+    cf_amounts = generate_development_cash_flow_amounts(
+        total_construction_cost=total_cost,
+        annual_noi=annual_noi,
+        timeline=timeline,
+        exit_cap_rate=modified_assumptions.exit_cap_rate,
+        soft_cost_pct=assumptions.soft_cost_pct
+    )[1:]
+
+    # Calculate NPV
+    npv = calculate_npv(
+        cash_flows=cf_amounts,
+        discount_rate=assumptions.discount_rate,
+        initial_investment=total_cost
+    )
+
+    return npv
+
+
+def _calculate_scenario_npvs(
+    samples: Dict[str, np.ndarray],
+    base_params: Dict[str, Any],
+    num_units: int,
+    buildable_sf: float,
+    affordable_pct: float
+) -> np.ndarray:
+    """
+    Calculate NPVs for a batch of scenarios in one vectorized pass.
 
-        # Extract cash flow amounts (skip period 0 which is initial investment)
-        cf_amounts = [cf.amount for cf in cash_flows_data[1:]]
+    Produces the same values as calling _calculate_scenario_npv once per
+    scenario, using the closed-form development present value instead of
+    building and discounting each cash flow series. samples maps parameter
+    names (Monte Carlo draws or stacked tornado perturbations) to arrays of
+    equal length; parameters it omits take their base_params value.
+    """
+    assumptions = base_params['assumptions']
 
-        # Calculate NPV
-        npv = calculate_npv(
-            cash_flows=cf_amounts,
-            discount_rate=assumptions.discount_rate,
-            initial_investment=total_cost
+    def scenario_values(name: str, default: Any) -> Any:
+        return samples.get(name, base_params.get(name, default))
+
+    # Costs vary with cost per SF and quality
+    total_costs = (
+        buildable_sf
+        * np.asarray(scenario_values('cost_per_sf', None), dtype=np.float64)
+        * np.asarray(scenario_values('quality_factor', 1.0), dtype=np.float64)
+    )
+
+    # NOI depends only on rent level; evaluate it once per distinct rent
+    rents = np.asarray(
+        scenario_values('avg_rent_per_sf_month', assumptions.avg_rent_per_sf_month),
+        dtype=np.float64
+    )
+    unique_rents, rent_index = np.unique(rents, return_inverse=True)
+    annual_noi = np.array([
+        _estimate_revenue_simple(
+            num_units,
+            buildable_sf,
+            assumptions.model_copy(update={'avg_rent_per_sf_month': float(rent)}),
+            affordable_pct
         )
+        for rent in unique_rents
+    ])[rent_index.reshape(rents.shape)]
+
+    # Construction delays truncate to whole months, as in the scalar path
+    construction_months = np.trunc(
+        assumptions.construction_months
+        + np.asarray(scenario_values('construction_delay_months', 0), dtype=np.float64)
+    )
 
-        return npv
+    timeline = CashFlowTimeline(
+        predevelopment_months=assumptions.predevelopment_months,
+        construction_months=assumptions.construction_months,
+        lease_up_months=assumptions.lease_up_months,
+        operations_years=assumptions.holding_period_years
+    )
+
+    # Discount periods 1..n in closed form; period 0 is replaced by the
+    # initial investment, matching _calculate_scenario_npv
+    present_values = calculate_development_present_values(
+        total_construction_cost=total_costs,
+        annual_noi=annual_noi,
+        construction_months=construction_months,
+        exit_cap_rate=scenario_values('exit_cap_rate', assumptions.exit_cap_rate),
+        timeline=timeline,
+        discount_rate=assumptions.discount_rate,
+        soft_cost_pct=assumptions.soft_cost_pct,
+        include_first_period=False
+    )
 
-    return calculate_scenario_npv
+    return present_values - total_costs
 
 
 # ============================================================================
@@ -346,38 +438,27 @@ async def analyze_economic_feasibility(
     # Step 3: Generate cash flows
     logger.info("Generating development cash flows...")
 
-    timeline = TimelineInputs(
+    timeline = CashFlowTimeline(
         predevelopment_months=assumptions.predevelopment_months,
         construction_months=assumptions.construction_months,
         lease_up_months=assumptions.lease_up_months,
         operations_years=assumptions.holding_period_years
     )
 
-    cash_flows_data = generate_development_cash_flows(
+    # One list per field, built straight from the period layout
+    cash_flows = CashFlowSeries(**generate_development_cash_flow_columns(
         total_construction_cost=cost_estimate.total_cost,
         annual_noi=annual_noi,
         timeline=timeline,
         exit_cap_rate=assumptions.exit_cap_rate,
         soft_cost_pct=assumptions.soft_cost_pct
-    )
-
-    # Convert to API model
-    cash_flows = [
-        CashFlowPeriod(
-            period=cf.period,
-            description=cf.description,
-            amount=cf.amount,
-            cumulative=cf.cumulative,
-            phase=cf.phase
-        )
-        for cf in cash_flows_data
-    ]
+    ))
 
     # Step 4: Calculate financial metrics
     logger.info("Calculating financial metrics (NPV, IRR, payback, PI)...")
 
-    # Extract cash flow amounts (skip period 0)
-    cf_amounts = [cf.amount for cf in cash_flows_data[1:]]
+    # Cash flow amounts (skip period 0)
+    cf_amounts = cash_flows.amount[1:]
 
     npv = calculate_npv(
         cash_flows=cf_amounts,
@@ -462,7 +543,6 @@ async def analyze_economic_feasibility(
         request_summary=request_summary,
         cost_estimate=cost_estimate,
         revenue_projection=revenue_projection,
-        cash_flows=cash_flows,
         financial_metrics=financial_metrics,
         sensitivity_analysis=sensitivity_analysis,
         recommendation=recommendation,
@@ -518,6 +598,15 @@ async def _run_sensitivity_analysis(
         affordable_pct=request.affordable_pct
     )
 
+    # Vectorized NPV for stacked tornado scenarios and Monte Carlo samples
+    batch_npv_function = partial(
+        _calculate_scenario_npvs,
+        base_params=base_params,
+        num_units=request.num_units,
+        buildable_sf=buildable_sf,
+        affordable_pct=request.affordable_pct
+    )
+
     # Tornado sensitivity analysis
     if request.run_tornado_sensitivity:
         logger.info("Running tornado sensitivity analysis...")
@@ -569,7 +658,8 @@ async def _run_sensitivity_analysis(
         tornado_results_raw = calculate_tornado_sensitivity(
             base_scenario=base_params,
             variables_to_test=sensitivity_inputs,
-            npv_function=npv_function
+            npv_function=npv_function,
+            batch_npv_function=batch_npv_function
         )
 
         # Convert to API model
@@ -611,13 +701,16 @@ async def _run_sensitivity_analysis(
             cap_rate_mode=mc_config.cap_rate_mode,
             cap_rate_max=mc_config.cap_rate_max,
             construction_delay_mean=mc_config.construction_delay_mean,
-            construction_delay_std=mc_config.construction_delay_std
+            construction_delay_std=mc_config.construction_delay_std,
+            # Only summary statistics and the histogram are returned by the API
+            retain_samples=False
         )
 
         mc_result = run_monte_carlo_simulation(
             base_params=base_params,
             monte_carlo_inputs=mc_inputs,
-            npv_function=npv_function
+            npv_function=npv_function,
+            batch_npv_function=batch_npv_function
         )
 
         # Convert to API model
@@ -727,6 +820,26 @@ def _generate_recommendation(
     ]
 
 
+# Fixed sections of every analysis's source notes. Tuples, so the single
+# shared copy cannot be modified through one analysis; they serialize as
+# JSON arrays like the lists they replace.
+_SOURCE_NOTE_DATA_SOURCES = (
+    "FRED (Federal Reserve Economic Data) for PPI and interest rates",
+    "Industry-standard cost estimating databases (RSMeans proxy)",
+    "HUD Fair Market Rent data for revenue assumptions",
+    "California HCD Income Limits for affordable housing calculations",
+    "Real Estate Finance and Investment Manual (methodology)",
+    "Urban Land Institute Dollars & Cents of Development (benchmarks)",
+)
+_SOURCE_NOTE_DISCLAIMERS = (
+    "This analysis is a preliminary feasibility estimate based on assumed inputs",
+    "Actual costs and revenues will vary based on market conditions, design, and execution",
+    "Recommend detailed market study, architectural programming, and cost estimating",
+    "Financial projections are not guarantees of future performance",
+    "This analysis does not constitute investment advice",
+)
+
+
 def _compile_source_notes(
     cost_estimate: ConstructionCostEstimate,
     revenue_projection: RevenueProjection,
@@ -781,24 +894,9 @@ def _compile_source_notes(
             "operations": f"{assumptions.holding_period_years} years before sale"
         },
 
-        # Data sources
-        "data_sources": [
-            "FRED (Federal Reserve Economic Data) for PPI and interest rates",
-            "Industry-standard cost estimating databases (RSMeans proxy)",
-            "HUD Fair Market Rent data for revenue assumptions",
-            "California HCD Income Limits for affordable housing calculations",
-            "Real Estate Finance and Investment Manual (methodology)",
-            "Urban Land Institute Dollars & Cents of Development (benchmarks)"
-        ],
-
-        # Disclaimers
-        "disclaimers": [
-            "This analysis is a preliminary feasibility estimate based on assumed inputs",
-            "Actual costs and revenues will vary based on market conditions, design, and execution",
-            "Recommend detailed market study, architectural programming, and cost estimating",
-            "Financial projections are not guarantees of future performance",
-            "This analysis does not constitute investment advice"
-        ]
+        # Data sources and disclaimers (shared, never rebuilt per analysis)
+        "data_sources": _SOURCE_NOTE_DATA_SOURCES,
+        "disclaimers": _SOURCE_NOTE_DISCLAIMERS,
     }
 
     return source_notes
@@ -37,6 +37,14 @@ from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Rent dictionary keys by bedroom count
+BEDROOM_LABELS: Dict[int, str] = {0: "studio", 1: "1br", 2: "2br", 3: "3br", 4: "4br"}
+
+
+def _bedroom_label(bedrooms: int) -> str:
+    """Rent dictionary key for a bedroom count (e.g. 0 -> "studio", 5 -> "5br")."""
+    return BEDROOM_LABELS.get(bedrooms) or f"{bedrooms}br"
+
 
 class RevenueInputs(BaseModel):
     """Revenue calculation inputs."""
@@ -276,13 +284,6 @@ async def calculate_market_rents(
 
     # Calculate rents by bedroom type with quality adjustment
     market_rents = {}
-    bedroom_labels = {
-        0: "studio",
-        1: "1br",
-        2: "2br",
-        3: "3br",
-        4: "4br"
-    }
 
     for bedrooms, count in unit_mix.items():
         if count > 0:
@@ -293,7 +294,7 @@ async def calculate_market_rents(
             adjusted_rent = base_fmr * quality_factor
 
             # Store with label
-            label = bedroom_labels.get(bedrooms, f"{bedrooms}br")
+            label = _bedroom_label(bedrooms)
             market_rents[label] = adjusted_rent
 
             logger.info(
@@ -350,13 +351,6 @@ def calculate_affordable_rents(
     )
 
     affordable_rents = {}
-    bedroom_labels = {
-        0: "studio",
-        1: "1br",
-        2: "2br",
-        3: "3br",
-        4: "4br"
-    }
 
     for bedrooms, count in unit_mix_affordable.items():
         if count > 0:
@@ -375,7 +369,7 @@ def calculate_affordable_rents(
             avg_rent = sum(rents) / len(rents)
 
             # Store with label
-            label = bedroom_labels.get(bedrooms, f"{bedrooms}br")
+            label = _bedroom_label(bedrooms)
             affordable_rents[label] = avg_rent
 
             logger.info(
@@ -419,24 +413,17 @@ def calculate_gross_income(
         >>> print(f"Annual GPI: ${gpi:,.0f}")
         Annual GPI: $876,000
     """
-    bedroom_labels = {0: "studio", 1: "1br", 2: "2br", 3: "3br", 4: "4br"}
     gpi = 0.0
 
-    # Market-rate income
-    for bedrooms, count in market_unit_mix.items():
-        label = bedroom_labels.get(bedrooms, f"{bedrooms}br")
-        if label in market_rents:
-            monthly_rent = market_rents[label]
-            annual_income = monthly_rent * count * 12
-            gpi += annual_income
-
-    # Affordable income
-    for bedrooms, count in affordable_unit_mix.items():
-        label = bedroom_labels.get(bedrooms, f"{bedrooms}br")
-        if label in affordable_rents:
-            monthly_rent = affordable_rents[label]
-            annual_income = monthly_rent * count * 12
-            gpi += annual_income
+    # Market-rate income, then affordable income
+    for rents, unit_mix in (
+        (market_rents, market_unit_mix),
+        (affordable_rents, affordable_unit_mix),
+    ):
+        for bedrooms, count in unit_mix.items():
+            monthly_rent = rents.get(_bedroom_label(bedrooms))
+            if monthly_rent is not None:
+                gpi += monthly_rent * count * 12
 
     return gpi
 
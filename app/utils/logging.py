@@ -11,11 +11,43 @@ This module provides centralized logging configuration with support for:
 import logging
 import sys
 import json
+from contextvars import ContextVar, Token
 from datetime import datetime
 from typing import Dict, Any, Optional
 from app.core.config import settings
 
 
+# Structured fields bound for the current request (or task); merged into every
+# JSON log record so call sites don't rebuild ``extra`` dicts
+_log_context: ContextVar[Dict[str, Any]] = ContextVar("log_context", default={})
+
+
+def bind_log_context(**fields: Any) -> Token:
+    """
+    Bind structured fields to all subsequent log records in this context.
+
+    Fields are merged with any already bound. Pass the returned token to
+    reset_log_context() to restore the previous fields.
+
+    Args:
+        **fields: Field names and values to include in JSON log output
+
+    Returns:
+        Token for reset_log_context()
+    """
+    return _log_context.set({**_log_context.get(), **fields})
+
+
+def reset_log_context(token: Token) -> None:
+    """
+    Restore the log context that was active before bind_log_context().
+
+    Args:
+        token: Token returned by bind_log_context()
+    """
+    _log_context.reset(token)
+
+
 class JSONFormatter(logging.Formatter):
     """Custom JSON formatter for structured logging."""
 
@@ -31,6 +63,11 @@ class JSONFormatter(logging.Formatter):
             "line": record.lineno,
         }
 
+        # Add fields bound to the current request context
+        context = _log_context.get()
+        if context:
+            log_data.update(context)
+
         # Add extra fields if present
         if hasattr(record, "extra"):
             log_data.update(record.extra)
@@ -17,6 +17,6 @@ alembic upgrade head || {
 
 echo "Migrations complete!"
 
-# Start uvicorn server
+# Start uvicorn server (uvloop event loop + httptools parser, both from uvicorn[standard])
 echo "Starting uvicorn server..."
-exec uvicorn app.main:app --host 0.0.0.0 --port ${PORT:-8000}
+exec uvicorn app.main:app --host 0.0.0.0 --port ${PORT:-8000} --loop uvloop --http httptools
@@ -5,5 +5,5 @@ echo "Starting Parcel Feasibility Engine..."
 echo "PORT: ${PORT:-8000}"
 echo "ENVIRONMENT: ${ENVIRONMENT:-development}"
 
-# Start uvicorn
-exec uvicorn app.main:app --host 0.0.0.0 --port ${PORT:-8000}
+# Start uvicorn (uvloop event loop + httptools parser, both from uvicorn[standard])
+exec uvicorn app.main:app --host 0.0.0.0 --port ${PORT:-8000} --loop uvloop --http httptools
@@ -15,6 +15,7 @@ from app.models.economic_feasibility import (
     RevenueProjection,
     TimelineInputs,
     CashFlow,
+    CashFlowSeries,
     FinancialMetrics,
     SensitivityInput,
     TornadoResult,
@@ -304,6 +305,34 @@ class TestCashFlow:
             )
 
 
+
+class TestCashFlowSeries:
+    """Tests for CashFlowSeries model."""
+
+    def test_to_periods_round_trip(self):
+        """Test to_periods rebuilds each period and converts back unchanged."""
+        series = CashFlowSeries(
+            period=[0, 1, 2],
+            description=["Predevelopment (6 months)", "Construction Year 1", "Exit"],
+            amount=[-500000.0, -4500000.0, 10000000.0],
+            cumulative=[-500000.0, -5000000.0, 5000000.0],
+            phase=["predevelopment", "construction", "exit"]
+        )
+
+        periods = series.to_periods()
+
+        assert len(periods) == 3
+        assert periods[1].description == "Construction Year 1"
+        assert periods[2].cumulative == 5000000.0
+
+        rebuilt = CashFlowSeries(**{
+            field: [getattr(period, field) for period in periods]
+            for field in CashFlowSeries.model_fields
+        })
+        assert rebuilt == series
+        assert rebuilt.model_dump() == series.model_dump()
+
+
 class TestMonteCarloInputs:
     """Tests for MonteCarloInputs model."""
 
@@ -0,0 +1,99 @@
+"""
+Tests for the economic feasibility service scenario evaluation.
+
+Tests cover:
+- Vectorized scenario NPVs (_calculate_scenario_npvs) against the
+  per-scenario scalar path (_calculate_scenario_npv)
+"""
+import numpy as np
+import pytest
+
+from app.models.economic import EconomicAssumptions
+from app.services.economic_feasibility import (
+    _calculate_scenario_npv,
+    _calculate_scenario_npvs,
+)
+
+
+NUM_UNITS = 40
+BUILDABLE_SF = 36000.0
+AFFORDABLE_PCT = 0.15
+
+
+@pytest.fixture
+def base_params():
+    """Base scenario parameters as built by the sensitivity analysis."""
+    assumptions = EconomicAssumptions()
+    return {
+        'assumptions': assumptions,
+        'cost_per_sf': 450.0,
+        'quality_factor': assumptions.quality_factor,
+        'avg_rent_per_sf_month': assumptions.avg_rent_per_sf_month,
+        'exit_cap_rate': assumptions.exit_cap_rate,
+        'rent_growth_rate': assumptions.rent_growth_rate,
+        'construction_delay_months': 0
+    }
+
+
+def scalar_npvs(samples, base_params):
+    """Evaluate each scenario separately through the scalar path."""
+    n = len(next(iter(samples.values())))
+    return np.array([
+        _calculate_scenario_npv(
+            {**base_params, **{name: float(values[i]) for name, values in samples.items()}},
+            base_params,
+            NUM_UNITS,
+            BUILDABLE_SF,
+            AFFORDABLE_PCT
+        )
+        for i in range(n)
+    ])
+
+
+class TestCalculateScenarioNpvs:
+    """Tests for the vectorized scenario NPV function."""
+
+    def test_matches_scalar_path_on_monte_carlo_samples(self, base_params):
+        """Test batch NPVs match per-scenario NPVs for random Monte Carlo draws."""
+        rng = np.random.default_rng(7)
+        n = 200
+        samples = {
+            'cost_per_sf': rng.normal(450.0, 40.0, n),
+            'rent_growth_rate': np.clip(rng.normal(0.03, 0.015, n), 0, None),
+            'exit_cap_rate': rng.triangular(0.04, 0.05, 0.07, n),
+            'construction_delay_months': np.abs(rng.normal(0.0, 4.0, n)),
+        }
+
+        batch = _calculate_scenario_npvs(
+            samples, base_params, NUM_UNITS, BUILDABLE_SF, AFFORDABLE_PCT
+        )
+
+        assert batch.shape == (n,)
+        np.testing.assert_allclose(batch, scalar_npvs(samples, base_params), rtol=1e-10)
+
+    def test_matches_scalar_path_on_rent_and_quality(self, base_params):
+        """Test batch NPVs match for tornado-style rent and quality perturbations."""
+        assumptions = base_params['assumptions']
+        samples = {
+            'avg_rent_per_sf_month': assumptions.avg_rent_per_sf_month * np.array([0.8, 1.0, 1.2, 0.8]),
+            'quality_factor': np.array([0.9, 1.0, 1.1, 1.2]),
+        }
+
+        batch = _calculate_scenario_npvs(
+            samples, base_params, NUM_UNITS, BUILDABLE_SF, AFFORDABLE_PCT
+        )
+
+        np.testing.assert_allclose(batch, scalar_npvs(samples, base_params), rtol=1e-10)
+
+    def test_omitted_parameters_use_base_values(self, base_params):
+        """Test a single-variable batch evaluates the rest at base values."""
+        samples = {'cost_per_sf': np.array([450.0])}
+
+        batch = _calculate_scenario_npvs(
+            samples, base_params, NUM_UNITS, BUILDABLE_SF, AFFORDABLE_PCT
+        )
+        base_npv = _calculate_scenario_npv(
+            base_params, base_params, NUM_UNITS, BUILDABLE_SF, AFFORDABLE_PCT
+        )
+
+        assert batch[0] == pytest.approx(base_npv, rel=1e-12)
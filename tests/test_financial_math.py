@@ -0,0 +1,559 @@
+"""
+Tests for core financial math functions.
+
+Tests cover:
+- NPV and IRR calculation accuracy
+- Tornado sensitivity and its per-run memoization
+- Discount factor caching
+- Monte Carlo statistics, delay sampling and histogram binning
+- Development cash flow generation (list, array and column forms) and closed-form valuation
+"""
+import numpy as np
+import pytest
+
+from app.core.financial_math import (
+    _discount_factors,
+    _histogram,
+    _sample_construction_delay,
+    calculate_irr,
+    calculate_npv,
+    calculate_development_present_values,
+    calculate_tornado_sensitivity,
+    generate_development_cash_flow_amounts,
+    generate_development_cash_flow_columns,
+    generate_development_cash_flows,
+    run_monte_carlo_simulation,
+    MonteCarloInputs,
+    SensitivityInput,
+    TimelineInputs,
+)
+
+
+def _linear_npv(params):
+    """Simple NPV stand-in driven by the sampled Monte Carlo variables."""
+    return (
+        1_000_000
+        - 2_000 * params['cost_per_sf']
+        + 5_000_000 * params['rent_growth_rate']
+        - 10_000_000 * params['exit_cap_rate']
+        - 10_000 * params['construction_delay_months']
+    )
+
+
+@pytest.fixture
+def base_params():
+    """Base case parameters for Monte Carlo tests."""
+    return {
+        'cost_per_sf': 400.0,
+        'rent_growth_rate': 0.03,
+        'exit_cap_rate': 0.05,
+        'construction_delay_months': 0.0,
+    }
+
+
+class TestCalculateNPV:
+    """Tests for calculate_npv."""
+
+    def test_npv_matches_closed_form(self):
+        """NPV equals -investment plus the sum of discounted cash flows."""
+        cash_flows = [100.0, 100.0, 100.0]
+        expected = -200.0 + sum(cf / 1.10 ** (t + 1) for t, cf in enumerate(cash_flows))
+
+        assert calculate_npv(cash_flows, 0.10, 200.0) == pytest.approx(expected)
+
+    def test_npv_negative_when_underwater(self):
+        """Insufficient cash flows produce negative NPV."""
+        assert calculate_npv([50.0, 50.0, 50.0], 0.10, 200.0) < 0
+
+    def test_npv_empty_cash_flows(self):
+        """No cash flows returns the negative initial investment."""
+        assert calculate_npv([], 0.10, 200.0) == -200.0
+
+    def test_npv_accepts_ndarray(self):
+        """NumPy arrays give the same result as lists."""
+        cash_flows = [120.0, -30.0, 250.0]
+
+        assert calculate_npv(np.array(cash_flows), 0.08, 200.0) == pytest.approx(
+            calculate_npv(cash_flows, 0.08, 200.0)
+        )
+
+    def test_npv_empty_ndarray(self):
+        """An empty array behaves like an empty list."""
+        assert calculate_npv(np.array([]), 0.10, 200.0) == -200.0
+
+    def test_npv_zero_discount_rate(self):
+        """At a 0% discount rate NPV is the undiscounted sum."""
+        assert calculate_npv([100.0, 100.0], 0.0, 150.0) == pytest.approx(50.0)
+
+
+class TestCalculateIRR:
+    """Tests for calculate_irr."""
+
+    @pytest.mark.parametrize("cash_flows,investment", [
+        ([100.0, 100.0, 100.0], 200.0),
+        ([-50.0, 300.0, 500.0], 300.0),
+        ([100_000.0] * 15 + [3_000_000.0], 2_000_000.0),
+    ])
+    def test_irr_zeroes_npv(self, cash_flows, investment):
+        """Discounting at the IRR yields an NPV of zero."""
+        irr = calculate_irr(cash_flows, investment)
+
+        assert irr is not None
+        assert calculate_npv(cash_flows, irr, investment) == pytest.approx(0.0, abs=1e-4)
+
+    def test_irr_negative_return_converges(self):
+        """Deeply negative IRRs converge instead of diverging from a 10% guess."""
+        irr = calculate_irr([10.0, 10.0, 10.0], 200.0)
+
+        assert irr == pytest.approx(-0.56734, abs=1e-5)
+
+    def test_irr_no_solution(self):
+        """Cash flows that never change sign have no IRR."""
+        assert calculate_irr([0.0, 0.0, 0.0], 100.0) is None
+
+    def test_irr_long_stream_uses_newton(self):
+        """Streams beyond the polynomial-root limit still solve via Newton."""
+        cash_flows = [100_000.0] * 40
+        irr = calculate_irr(cash_flows, 1_000_000.0)
+
+        assert irr is not None
+        assert calculate_npv(cash_flows, irr, 1_000_000.0) == pytest.approx(0.0, abs=1e-3)
+
+    def test_irr_skips_root_solve_when_newton_converges(self, monkeypatch):
+        """Newton is the default; the polynomial-root solve is not consulted."""
+        def fail(*args):
+            raise AssertionError("polynomial-root solve should not run")
+
+        monkeypatch.setattr("app.core.financial_math._irr_from_polynomial_roots", fail)
+
+        assert calculate_irr([100.0, 100.0, 100.0], 200.0) == pytest.approx(0.23375, abs=1e-5)
+
+    def test_irr_falls_back_to_root_solve(self, monkeypatch):
+        """When Newton fails, short streams are solved from polynomial roots."""
+        monkeypatch.setattr("app.core.financial_math._irr_newton", lambda *args: None)
+
+        assert calculate_irr([100.0, 100.0, 100.0], 200.0) == pytest.approx(0.23375, abs=1e-5)
+        assert calculate_irr([100_000.0] * 40, 1_000_000.0) is None
+
+    def test_irr_multiple_roots_picks_closest_to_ten_percent(self):
+        """Non-conventional flows with two IRRs (10% and 20%) return 10%."""
+        # -100 + 230x - 132x^2 has roots at x = 1/1.1 and x = 1/1.2
+        assert calculate_irr([230.0, -132.0], 100.0) == pytest.approx(0.10)
+
+    def test_irr_guess_selects_root(self):
+        """An explicit guess steers the solver to the nearer of two IRRs."""
+        assert calculate_irr([230.0, -132.0], 100.0, guess=0.25) == pytest.approx(0.20)
+        assert calculate_irr(
+            [230.0, -132.0] + [0.0] * 40, 100.0, guess=0.25
+        ) == pytest.approx(0.20)
+
+    def test_irr_known_value(self):
+        """Three equal inflows of 100 on 200 invested return about 23.4%."""
+        assert calculate_irr([100.0, 100.0, 100.0], 200.0) == pytest.approx(0.23375, abs=1e-5)
+
+    def test_irr_accepts_ndarray(self):
+        """NumPy arrays give the same result as lists."""
+        assert calculate_irr(np.array([100.0, 100.0, 100.0]), 200.0) == pytest.approx(
+            calculate_irr([100.0, 100.0, 100.0], 200.0)
+        )
+
+    def test_irr_empty_cash_flows(self):
+        """No cash flows has no IRR."""
+        assert calculate_irr([], 200.0) is None
+
+
+class TestDiscountFactors:
+    """Tests for the cached discount factor vector."""
+
+    def test_discount_factors_values(self):
+        """Factors are 1/(1+r)^t for t = 1..n."""
+        factors = _discount_factors(0.10, 3)
+
+        np.testing.assert_allclose(factors, [1 / 1.1, 1 / 1.21, 1 / 1.331])
+
+    def test_discount_factors_cached_and_read_only(self):
+        """Same (rate, length) returns the shared, read-only vector."""
+        first = _discount_factors(0.08, 12)
+        second = _discount_factors(0.08, 12)
+
+        assert first is second
+        assert not first.flags.writeable
+
+
+class TestConstructionDelaySampling:
+    """Tests for the lognormal construction delay sampler."""
+
+    def test_lognormal_matches_requested_moments(self):
+        """Sample mean and std match the requested delay moments."""
+        samples = _sample_construction_delay(np.random.default_rng(0), mean=4.0, std=2.0, size=200_000)
+
+        assert samples.min() > 0
+        assert samples.mean() == pytest.approx(4.0, rel=0.02)
+        assert samples.std() == pytest.approx(2.0, rel=0.05)
+
+    def test_zero_mean_keeps_clamped_normal(self):
+        """A zero mean draws Normal(0, std) clamped at zero, as before."""
+        samples = _sample_construction_delay(np.random.default_rng(0), mean=0.0, std=3.0, size=5)
+        expected = np.maximum(np.random.default_rng(0).normal(0.0, 3.0, size=5), 0)
+
+        np.testing.assert_array_equal(samples, expected)
+
+    def test_default_config_delay_statistics(self):
+        """Default Monte Carlo delays (mean 0, std 3) keep the clamped-normal moments."""
+        defaults = MonteCarloInputs()
+        samples = _sample_construction_delay(
+            np.random.default_rng(0),
+            mean=defaults.construction_delay_mean,
+            std=defaults.construction_delay_std,
+            size=200_000
+        )
+
+        # Normal(0, 3) clamped at 0: mean 3/sqrt(2π), std 3·sqrt(1/2 - 1/(2π))
+        assert (samples == 0).mean() == pytest.approx(0.5, abs=0.01)
+        assert samples.mean() == pytest.approx(3.0 / np.sqrt(2 * np.pi), rel=0.02)
+        assert samples.std() == pytest.approx(3.0 * np.sqrt(0.5 - 1 / (2 * np.pi)), rel=0.02)
+
+    def test_zero_std_is_deterministic(self):
+        """Without dispersion every draw equals the mean."""
+        samples = _sample_construction_delay(np.random.default_rng(0), mean=2.0, std=0.0, size=5)
+
+        np.testing.assert_array_equal(samples, np.full(5, 2.0))
+
+
+class TestHistogram:
+    """Tests for the Monte Carlo histogram helper."""
+
+    @pytest.mark.parametrize("values", [
+        np.random.default_rng(7).normal(1_000_000, 250_000, size=5_000),
+        np.random.default_rng(7).integers(0, 10, size=1_000).astype(float),
+        # Values sitting exactly on bin edges, where rounding is most likely
+        np.linspace(-3.7, 11.3, 501),
+        np.arange(0, 101) * 0.1,
+    ])
+    def test_matches_numpy_histogram(self, values):
+        """Counts and edges match np.histogram with the same bin count."""
+        counts, edges = _histogram(values, num_bins=50)
+        expected_counts, expected_edges = np.histogram(values, bins=50)
+
+        np.testing.assert_array_equal(counts, expected_counts)
+        np.testing.assert_allclose(edges, expected_edges)
+
+    def test_constant_values(self):
+        """A degenerate range still produces num_bins bins holding every sample."""
+        counts, edges = _histogram(np.full(10, 5.0), num_bins=50)
+
+        assert len(counts) == 50
+        assert len(edges) == 51
+        assert counts.sum() == 10
+
+
+class TestTornadoSensitivity:
+    """Tests for calculate_tornado_sensitivity."""
+
+    def test_results_sorted_by_impact(self):
+        """Variables are ranked by absolute NPV swing."""
+        base = {'revenue': 1000.0, 'cost': 800.0}
+        variables = [
+            SensitivityInput('cost', 800.0, 0.10, 'Cost'),
+            SensitivityInput('revenue', 1000.0, 0.10, 'Revenue'),
+        ]
+
+        results = calculate_tornado_sensitivity(
+            base, variables, lambda p: p['revenue'] - p['cost']
+        )
+
+        assert [r.variable_name for r in results] == ['revenue', 'cost']
+        assert results[0].base_npv == pytest.approx(200.0)
+        assert results[0].downside_npv == pytest.approx(100.0)
+        assert results[0].upside_npv == pytest.approx(300.0)
+        assert results[1].impact == pytest.approx(160.0)
+
+    def test_base_scenario_not_mutated(self):
+        """Perturbations never leak into the caller's base scenario."""
+        base = {'revenue': 1000.0, 'cost': 800.0}
+        seen = []
+
+        def npv(params):
+            seen.append(dict(params))
+            return params['revenue'] - params['cost']
+
+        calculate_tornado_sensitivity(
+            base,
+            [
+                SensitivityInput('revenue', 1000.0, 0.10, 'Revenue'),
+                SensitivityInput('cost', 800.0, 0.10, 'Cost'),
+            ],
+            npv,
+        )
+
+        assert base == {'revenue': 1000.0, 'cost': 800.0}
+        # Each perturbed scenario changes exactly one variable
+        assert seen[3] == {'revenue': 1000.0, 'cost': 720.0}
+
+    def test_repeated_scenarios_evaluated_once(self):
+        """Perturbations equal to the base case or to earlier ones reuse their NPV."""
+        base = {'revenue': 1000.0, 'delay': 0.0}
+        calls = []
+
+        def npv(params):
+            calls.append(dict(params))
+            return params['revenue'] - 10 * params['delay']
+
+        results = calculate_tornado_sensitivity(
+            base,
+            [
+                SensitivityInput('delay', 0.0, 0.50, 'Delay'),
+                SensitivityInput('revenue', 1000.0, 0.10, 'Revenue'),
+                SensitivityInput('revenue', 1000.0, 0.10, 'Revenue (again)'),
+            ],
+            npv,
+        )
+
+        # Base case plus the two distinct revenue perturbations
+        assert len(calls) == 3
+        delay = next(r for r in results if r.variable_name == 'delay')
+        assert delay.downside_npv == delay.upside_npv == delay.base_npv == 1000.0
+        assert results[0].impact == results[1].impact == pytest.approx(200.0)
+
+    def test_batch_npv_function_stacks_perturbations(self):
+        """All downside/upside scenarios are valued in one batch call."""
+        base = {'revenue': 1000.0, 'cost': 800.0, 'delay': 0.0}
+        variables = [
+            SensitivityInput('cost', 800.0, 0.10, 'Cost'),
+            SensitivityInput('revenue', 1000.0, 0.10, 'Revenue'),
+            SensitivityInput('delay', 0.0, 0.50, 'Delay'),
+        ]
+        batches = []
+
+        def batch_npv(columns):
+            batches.append(columns)
+            return columns['revenue'] - columns['cost'] - 10 * columns['delay']
+
+        def npv(params):
+            return params['revenue'] - params['cost'] - 10 * params['delay']
+
+        results = calculate_tornado_sensitivity(base, variables, npv, batch_npv)
+        expected = calculate_tornado_sensitivity(base, variables, npv)
+
+        assert len(batches) == 1
+        np.testing.assert_allclose(batches[0]['cost'], [720, 880, 800, 800, 800, 800])
+        np.testing.assert_allclose(batches[0]['revenue'], [1000, 1000, 900, 1100, 1000, 1000])
+        assert results == expected
+
+
+class TestMonteCarloSimulation:
+    """Tests for run_monte_carlo_simulation."""
+
+    def test_statistics_consistent_with_samples(self, base_params):
+        """Summary statistics are derived from the returned NPV array."""
+        result = run_monte_carlo_simulation(
+            base_params, MonteCarloInputs(iterations=2_000, seed=1), _linear_npv
+        )
+        npvs = result.npv_array
+
+        assert result.iterations == 2_000
+        assert result.median_npv == pytest.approx(np.median(npvs))
+        assert result.percentile_5 == pytest.approx(np.percentile(npvs, 5))
+        assert result.percentile_95 == pytest.approx(np.percentile(npvs, 95))
+        assert result.percentile_5 <= result.percentile_25 <= result.median_npv
+        assert result.median_npv <= result.percentile_75 <= result.percentile_95
+        assert result.probability_positive == pytest.approx(np.mean(npvs > 0))
+        assert result.mean_npv == pytest.approx(np.mean(npvs))
+        assert result.std_npv == pytest.approx(np.std(npvs))
+        assert result.histogram_counts.sum() == 2_000
+        assert result.histogram_bins[0] == npvs.min()
+        assert result.histogram_bins[-1] == npvs.max()
+
+    def test_seed_is_reproducible(self, base_params):
+        """The same seed yields identical draws."""
+        inputs = MonteCarloInputs(iterations=500, seed=123)
+
+        first = run_monte_carlo_simulation(base_params, inputs, _linear_npv)
+        second = run_monte_carlo_simulation(base_params, inputs, _linear_npv)
+
+        np.testing.assert_array_equal(first.npv_array, second.npv_array)
+
+    def test_global_random_state_untouched(self, base_params):
+        """Sampling uses its own generator rather than reseeding np.random."""
+        np.random.seed(5)
+        expected = np.random.random(3)
+        np.random.seed(5)
+
+        run_monte_carlo_simulation(
+            base_params, MonteCarloInputs(iterations=100, seed=1), _linear_npv
+        )
+
+        np.testing.assert_array_equal(np.random.random(3), expected)
+
+    def test_base_params_not_mutated(self, base_params):
+        """Sampled values never leak into the caller's base parameters."""
+        original = dict(base_params)
+
+        run_monte_carlo_simulation(
+            base_params, MonteCarloInputs(iterations=100, seed=1), _linear_npv
+        )
+
+        assert base_params == original
+
+    def test_parallel_workers_match_serial(self, base_params):
+        """Worker processes reproduce the serial result exactly."""
+        serial = run_monte_carlo_simulation(
+            base_params, MonteCarloInputs(iterations=1_000, seed=9), _linear_npv
+        )
+        parallel = run_monte_carlo_simulation(
+            base_params, MonteCarloInputs(iterations=1_000, seed=9, workers=2), _linear_npv
+        )
+
+        np.testing.assert_array_equal(serial.npv_array, parallel.npv_array)
+
+    def test_batch_npv_function_matches_per_scenario(self, base_params):
+        """A vectorized NPV function sees the same samples as the scalar one."""
+        def batch_linear_npv(samples):
+            return _linear_npv(samples)
+
+        scalar = run_monte_carlo_simulation(
+            base_params, MonteCarloInputs(iterations=1_000, seed=4), _linear_npv
+        )
+        batched = run_monte_carlo_simulation(
+            base_params,
+            MonteCarloInputs(iterations=1_000, seed=4),
+            _linear_npv,
+            batch_npv_function=batch_linear_npv,
+        )
+
+        np.testing.assert_allclose(batched.npv_array, scalar.npv_array)
+        assert batched.mean_npv == pytest.approx(scalar.mean_npv)
+
+    def test_batch_function_split_across_workers(self, base_params):
+        """Worker chunks of a vectorized NPV function reassemble in order."""
+        serial = run_monte_carlo_simulation(
+            base_params,
+            MonteCarloInputs(iterations=1_000, seed=6),
+            _linear_npv,
+            batch_npv_function=_linear_npv,
+        )
+        parallel = run_monte_carlo_simulation(
+            base_params,
+            MonteCarloInputs(iterations=1_000, seed=6, workers=3),
+            _linear_npv,
+            batch_npv_function=_linear_npv,
+        )
+
+        np.testing.assert_array_equal(serial.npv_array, parallel.npv_array)
+
+    def test_workers_none_uses_cpu_count(self, base_params, monkeypatch):
+        """workers=None sizes the pool from os.cpu_count()."""
+        monkeypatch.setattr("app.core.financial_math.os.cpu_count", lambda: 2)
+        serial = run_monte_carlo_simulation(
+            base_params, MonteCarloInputs(iterations=200, seed=8), _linear_npv
+        )
+        auto = run_monte_carlo_simulation(
+            base_params, MonteCarloInputs(iterations=200, seed=8, workers=None), _linear_npv
+        )
+
+        np.testing.assert_array_equal(serial.npv_array, auto.npv_array)
+
+    def test_samples_can_be_dropped(self, base_params):
+        """Statistics are unchanged when the NPV array is not retained."""
+        retained = run_monte_carlo_simulation(
+            base_params, MonteCarloInputs(iterations=500, seed=3), _linear_npv
+        )
+        dropped = run_monte_carlo_simulation(
+            base_params,
+            MonteCarloInputs(iterations=500, seed=3, retain_samples=False),
+            _linear_npv,
+        )
+
+        assert dropped.npv_array is None
+        assert dropped.mean_npv == retained.mean_npv
+        assert dropped.percentile_95 == retained.percentile_95
+        np.testing.assert_array_equal(dropped.histogram_counts, retained.histogram_counts)
+
+
+class TestDevelopmentCashFlows:
+    """Tests for generate_development_cash_flows."""
+
+    def test_phases_and_descriptions(self):
+        """Cash flows cover every phase with readable descriptions."""
+        cash_flows = generate_development_cash_flows(
+            5_000_000, 500_000, TimelineInputs(6, 18, 6, 10), 0.05
+        )
+
+        phases = [cf.phase for cf in cash_flows]
+        assert phases[0] == "predevelopment"
+        assert phases[-1] == "exit"
+        assert phases.count("operations") == 10
+        assert cash_flows[1].description == "Construction Year 1"
+        assert cash_flows[-1].amount == pytest.approx(10_000_000)
+
+    @pytest.mark.parametrize("timeline", [
+        TimelineInputs(6, 18, 6, 10),
+        TimelineInputs(0, 12, 0, 5),
+        TimelineInputs(12, 24, 13, 3),
+    ])
+    def test_amounts_match_cash_flow_list(self, timeline):
+        """The array-only generator returns exactly the list's amounts."""
+        args = (5_000_000, 500_000, timeline, 0.05)
+        amounts = generate_development_cash_flow_amounts(*args)
+
+        assert amounts.tolist() == [cf.amount for cf in generate_development_cash_flows(*args)]
+
+    @pytest.mark.parametrize("timeline", [
+        TimelineInputs(6, 18, 6, 10),
+        TimelineInputs(0, 12, 0, 5),
+    ])
+    def test_columns_match_cash_flow_list(self, timeline):
+        """The column generator returns the list's fields one list per field."""
+        args = (5_000_000, 500_000, timeline, 0.05)
+        columns = generate_development_cash_flow_columns(*args)
+        cash_flows = generate_development_cash_flows(*args)
+
+        for field in ("period", "description", "amount", "cumulative", "phase"):
+            assert columns[field] == [getattr(cf, field) for cf in cash_flows]
+
+
+class TestDevelopmentPresentValues:
+    """Tests for calculate_development_present_values."""
+
+    @pytest.mark.parametrize("timeline", [
+        TimelineInputs(6, 18, 6, 10),
+        TimelineInputs(0, 12, 0, 5),
+        TimelineInputs(12, 24, 13, 0),
+    ])
+    @pytest.mark.parametrize("rate", [0.0, 0.08])
+    @pytest.mark.parametrize("include_first_period", [True, False])
+    def test_matches_discounted_cash_flows(self, timeline, rate, include_first_period):
+        """Closed form equals discounting each scenario's cash flows directly."""
+        costs = np.array([5_000_000.0, 3_000_000.0, 8_000_000.0])
+        nois = np.array([500_000.0, 250_000.0, 900_000.0])
+        months = np.array([18, 7, 37])
+        caps = np.array([0.05, 0.045, 0.065])
+
+        expected = []
+        for cost, noi, month, cap in zip(costs, nois, months, caps):
+            amounts = generate_development_cash_flow_amounts(
+                cost, noi,
+                TimelineInputs(
+                    timeline.predevelopment_months, int(month),
+                    timeline.lease_up_months, timeline.operations_years
+                ),
+                cap,
+            )
+            discount = (1.0 + rate) ** -np.arange(len(amounts))
+            if not include_first_period:
+                discount[0] = 0.0
+            expected.append(amounts @ discount)
+
+        result = calculate_development_present_values(
+            costs, nois, months.astype(float), caps, timeline, rate,
+            include_first_period=include_first_period,
+        )
+
+        np.testing.assert_allclose(result, expected, rtol=1e-10)
+
+    def test_non_positive_construction_rejected(self):
+        """A zero-length construction phase cannot be valued."""
+        with pytest.raises(ValueError):
+            calculate_development_present_values(
+                5_000_000, 500_000, 0.0, 0.05, TimelineInputs(6, 18, 6, 10), 0.10
+            )
@@ -0,0 +1,49 @@
+"""
+Tests for structured logging utilities.
+
+Tests cover:
+- Request-scoped log context in JSON output
+"""
+import json
+import logging
+
+from app.utils.logging import JSONFormatter, bind_log_context, reset_log_context
+
+
+def _format(message: str) -> dict:
+    """Format a log record with JSONFormatter and parse the output."""
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, message, None, None)
+    return json.loads(JSONFormatter().format(record))
+
+
+class TestLogContext:
+    """Tests for bind_log_context / reset_log_context."""
+
+    def test_bound_fields_in_json_output(self):
+        """Bound fields appear on every record until reset."""
+        token = bind_log_context(method="GET", path="/health")
+        try:
+            data = _format("Request started")
+        finally:
+            reset_log_context(token)
+
+        assert data["message"] == "Request started"
+        assert data["method"] == "GET"
+        assert data["path"] == "/health"
+        assert "method" not in _format("after reset")
+
+    def test_nested_binds_merge_and_restore(self):
+        """Later binds add fields; resetting restores the outer context."""
+        outer = bind_log_context(path="/api")
+        try:
+            inner = bind_log_context(status_code=200)
+            merged = _format("done")
+            reset_log_context(inner)
+            restored = _format("outer")
+        finally:
+            reset_log_context(outer)
+
+        assert merged["path"] == "/api"
+        assert merged["status_code"] == 200
+        assert restored["path"] == "/api"
+        assert "status_code" not in restored
@@ -0,0 +1,138 @@
+"""
+Tests for the FastAPI application entry point.
+
+Tests cover:
+- CORS origin matching
+- Request logging middleware
+- Pre-serialized health check response
+"""
+import logging
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app import main
+from app.main import app, is_allowed_origin, logger
+
+
+class TestIsAllowedOrigin:
+    """Tests for the wildcard-aware CORS origin checker."""
+
+    @pytest.mark.parametrize("origin", [
+        "http://localhost:3000",
+        "https://parcel-feasibility-engine.vercel.app",
+        "https://preview-123.vercel.app",
+    ])
+    def test_allowed_origins(self, origin):
+        """Exact and wildcard-matched origins are allowed."""
+        assert is_allowed_origin(origin)
+
+    @pytest.mark.parametrize("origin", [
+        "https://evil.com",
+        "https://preview.vercel.app.evil.com",
+        "http://localhost:3001",
+    ])
+    def test_rejected_origins(self, origin):
+        """Unlisted origins and suffix tricks are rejected."""
+        assert not is_allowed_origin(origin)
+
+
+class TestRequestLogging:
+    """Tests for the request logging middleware."""
+
+    def test_logging_skipped_above_info(self, monkeypatch):
+        """No log context is bound when INFO records would be discarded."""
+        def fail_bind(**fields):
+            raise AssertionError("log context should not be bound")
+
+        monkeypatch.setattr("app.main.bind_log_context", fail_bind)
+        previous_level = logger.level
+        logger.setLevel(logging.WARNING)
+        try:
+            response = TestClient(app).get("/health")
+        finally:
+            logger.setLevel(previous_level)
+
+        assert response.status_code == 200
+
+    def test_sub_millisecond_duration_logged(self, monkeypatch):
+        """Durations keep fractional milliseconds instead of truncating to 0."""
+        clock = iter([1_000_000, 1_250_000])
+        monkeypatch.setattr("app.main.time", SimpleNamespace(
+            perf_counter_ns=lambda: next(clock), monotonic=time.monotonic
+        ))
+
+        bound = {}
+        real_bind = main.bind_log_context
+
+        def record_bind(**fields):
+            bound.update(fields)
+            return real_bind(**fields)
+
+        monkeypatch.setattr("app.main.bind_log_context", record_bind)
+        previous_level = logger.level
+        logger.setLevel(logging.INFO)
+        try:
+            response = TestClient(app).get("/health")
+        finally:
+            logger.setLevel(previous_level)
+
+        assert response.status_code == 200
+        assert bound["duration_ms"] == 0.25
+
+    @pytest.mark.parametrize("level", [logging.INFO, logging.WARNING])
+    def test_no_server_timing_header(self, level):
+        """Responses do not expose server timing to clients."""
+        previous_level = logger.level
+        logger.setLevel(level)
+        try:
+            response = TestClient(app).get("/health")
+        finally:
+            logger.setLevel(previous_level)
+
+        assert response.status_code == 200
+        assert "Server-Timing" not in response.headers
+
+
+class TestHealthCheck:
+    """Tests for the /health endpoint."""
+
+    def test_health_payload(self):
+        """The templated body is valid JSON with a fresh timestamp."""
+        response = TestClient(app).get("/health")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        body = response.json()
+        assert body["status"] == "healthy"
+        assert body["version"] == settings.VERSION
+        assert body["features"]["sb9"] == settings.ENABLE_SB9
+        assert list(body)[:2] == ["status", "timestamp"]
+        assert abs((datetime.now() - datetime.fromisoformat(body["timestamp"])).total_seconds()) < 5
+
+    def test_timestamp_reused_within_a_second(self, monkeypatch):
+        """Probes inside the refresh window share one timestamp; later ones refresh it."""
+        clock = [1000.0]
+        monkeypatch.setattr("app.main.time.monotonic", lambda: clock[0])
+        monkeypatch.setattr("app.main._HEALTH_TIMESTAMP_CACHE", [float("-inf"), b""])
+        client = TestClient(app)
+
+        first = client.get("/health").json()["timestamp"]
+        clock[0] += 0.5
+        assert client.get("/health").json()["timestamp"] == first
+
+        clock[0] += 5.0
+        monkeypatch.setattr("app.main.datetime", _FixedDatetime)
+        assert client.get("/health").json()["timestamp"] == "2030-01-01T00:00:00"
+
+
+class _FixedDatetime(datetime):
+    """datetime stand-in whose now() is pinned, to observe cache refreshes."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return datetime(2030, 1, 1)
@@ -0,0 +1,77 @@
+"""
+Tests for the parcel cache model.
+
+Tests cover:
+- Table creation on SQLite (no trigram DDL)
+- pg_trgm setup when the database role cannot create extensions
+"""
+import logging
+from contextlib import nullcontext
+from types import SimpleNamespace
+
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.exc import ProgrammingError
+
+from app.models.parcel_cache import ParcelCache, _enable_pg_trgm, _pg_trgm_installed
+
+
+class FakePostgresConnection:
+    """Stand-in PostgreSQL connection recording executed SQL."""
+
+    dialect = SimpleNamespace(name="postgresql")
+
+    def __init__(self, error=None, extension_rows=()):
+        self.error = error
+        self.extension_rows = list(extension_rows)
+        self.statements = []
+
+    def begin_nested(self):
+        return nullcontext()
+
+    def execute(self, statement):
+        self.statements.append(str(statement))
+        if self.error is not None:
+            raise self.error
+        return SimpleNamespace(first=lambda: self.extension_rows[0] if self.extension_rows else None)
+
+
+class TestParcelCacheTable:
+    """Tests for creating the parcel_cache table."""
+
+    def test_sqlite_create_skips_trigram_indexes(self):
+        """SQLite databases get the table and B-tree indexes only."""
+        engine = create_engine("sqlite://")
+        ParcelCache.__table__.create(engine)
+
+        index_names = {index["name"] for index in inspect(engine).get_indexes("parcel_cache")}
+        assert "ix_parcel_cache_apn" in index_names
+        assert not any(name.endswith("_trgm") for name in index_names)
+
+
+class TestTrigramSetup:
+    """Tests for the pg_trgm extension hook and index condition."""
+
+    def test_extension_created_when_permitted(self):
+        """The hook issues CREATE EXTENSION on PostgreSQL."""
+        connection = FakePostgresConnection()
+
+        _enable_pg_trgm(ParcelCache.__table__, connection)
+
+        assert connection.statements == ["CREATE EXTENSION IF NOT EXISTS pg_trgm"]
+
+    def test_permission_denied_is_logged_not_raised(self, caplog):
+        """A role without CREATE privilege logs a warning instead of aborting startup."""
+        denied = ProgrammingError(
+            "CREATE EXTENSION", {}, Exception("permission denied to create extension")
+        )
+        connection = FakePostgresConnection(error=denied)
+
+        with caplog.at_level(logging.WARNING, logger="app.models.parcel_cache"):
+            _enable_pg_trgm(ParcelCache.__table__, connection)
+
+        assert "without trigram indexes" in caplog.text
+
+    def test_indexes_skipped_without_extension(self):
+        """Trigram indexes are emitted only when pg_trgm is installed."""
+        assert not _pg_trgm_installed(None, None, FakePostgresConnection())
+        assert _pg_trgm_installed(None, None, FakePostgresConnection(extension_rows=[(1,)]))
@@ -0,0 +1,278 @@
+"""
+Tests for authentication security utilities.
+
+Tests cover:
+- Password hashing and verification (sync and thread-offloaded)
+- JWT access/refresh token creation and verification
+- Password strength validation
+- Verified-token cache
+"""
+import time
+from datetime import timedelta
+
+import pytest
+
+import jwt
+from app.core.config import settings
+
+from app.core.security import (
+    _encode_token,
+    aget_password_hash,
+    averify_password,
+    clear_token_cache,
+    create_access_token,
+    create_refresh_token,
+    get_password_hash,
+    validate_password_strength,
+    verify_password,
+    verify_token,
+)
+
+
+@pytest.fixture(autouse=True)
+def fast_bcrypt(monkeypatch):
+    """Use the minimum bcrypt cost so hashing tests stay fast."""
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 4)
+
+
+@pytest.fixture(autouse=True)
+def empty_token_cache():
+    """Start every test without cached token verifications."""
+    clear_token_cache()
+    yield
+    clear_token_cache()
+
+
+class TestPasswordHashing:
+    """Tests for get_password_hash and verify_password."""
+
+    def test_hash_round_trip(self):
+        """A hashed password verifies against the original plaintext."""
+        hashed = get_password_hash("Secret123")
+
+        assert hashed.startswith("$2b$04$")
+        assert verify_password("Secret123", hashed)
+
+    def test_wrong_password_rejected(self):
+        """A different plaintext does not verify."""
+        hashed = get_password_hash("Secret123")
+
+        assert not verify_password("Secret124", hashed)
+
+    def test_malformed_hash_rejected(self):
+        """A stored value that is not a bcrypt hash fails verification."""
+        assert not verify_password("Secret123", "not-a-bcrypt-hash")
+
+    def test_long_password_truncated_consistently(self):
+        """Passwords beyond bcrypt's 72-byte limit hash and verify."""
+        password = "Aa1" * 40
+        hashed = get_password_hash(password)
+
+        assert verify_password(password, hashed)
+
+
+class TestAsyncPasswordHashing:
+    """Tests for the thread-offloaded password helpers."""
+
+    @pytest.mark.asyncio
+    async def test_async_round_trip(self):
+        """Async hashing and verification agree with the sync versions."""
+        hashed = await aget_password_hash("Secret123")
+
+        assert await averify_password("Secret123", hashed)
+        assert not await averify_password("Secret124", hashed)
+        assert verify_password("Secret123", hashed)
+
+
+class TestTokens:
+    """Tests for JWT creation and verification."""
+
+    def test_access_token_round_trip(self):
+        """An access token verifies and carries the user ID and epoch expiry."""
+        before = int(time.time())
+        payload = verify_token(create_access_token(42))
+
+        assert payload is not None
+        assert payload.sub == 42
+        assert payload.type == "access"
+        assert isinstance(payload.exp, int)
+        assert payload.exp - before == pytest.approx(
+            settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60, abs=2
+        )
+
+    def test_refresh_token_default_lifetime(self):
+        """Refresh tokens default to REFRESH_TOKEN_EXPIRE_DAYS."""
+        before = int(time.time())
+        payload = verify_token(create_refresh_token(7), token_type="refresh")
+
+        assert payload is not None
+        assert payload.exp - before == pytest.approx(
+            settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400, abs=2
+        )
+
+    def test_custom_expiry(self):
+        """expires_delta overrides the default lifetime."""
+        before = int(time.time())
+        payload = verify_token(create_access_token(1, expires_delta=timedelta(minutes=2)))
+
+        assert payload.exp - before == pytest.approx(120, abs=2)
+        assert payload.expires_at.timestamp() == payload.exp
+
+    @pytest.mark.parametrize("algorithm", ["HS256", "HS512"])
+    def test_encoded_token_matches_pyjwt(self, monkeypatch, algorithm):
+        """Locally signed HMAC tokens are byte-identical to PyJWT output."""
+        monkeypatch.setattr(settings, "JWT_ALGORITHM", algorithm)
+        claims = {"sub": "5", "exp": 2_000_000_000, "type": "access"}
+
+        assert _encode_token(claims) == jwt.encode(
+            claims, settings.JWT_SECRET_KEY, algorithm=algorithm
+        )
+
+    def test_asymmetric_algorithm_round_trip(self, monkeypatch):
+        """ES256 tokens are signed with the private key and verified with the public key."""
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric import ec
+
+        private_key = ec.generate_private_key(ec.SECP256R1())
+        monkeypatch.setattr(settings, "JWT_ALGORITHM", "ES256")
+        monkeypatch.setattr(settings, "JWT_PRIVATE_KEY", private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        ).decode())
+        monkeypatch.setattr(settings, "JWT_PUBLIC_KEY", private_key.public_key().public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        ).decode())
+
+        payload = verify_token(create_access_token(9))
+
+        assert payload is not None
+        assert payload.sub == 9
+
+    def test_eddsa_round_trip(self, monkeypatch):
+        """EdDSA tokens are signed with an Ed25519 private key and verified with its public key."""
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric import ed25519
+
+        private_key = ed25519.Ed25519PrivateKey.generate()
+        monkeypatch.setattr(settings, "JWT_ALGORITHM", "EdDSA")
+        monkeypatch.setattr(settings, "JWT_PRIVATE_KEY", private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        ).decode())
+        monkeypatch.setattr(settings, "JWT_PUBLIC_KEY", private_key.public_key().public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        ).decode())
+
+        payload = verify_token(create_access_token(11))
+
+        assert payload is not None
+        assert payload.sub == 11
+
+    def test_wrong_token_type_rejected(self):
+        """A refresh token cannot be used as an access token."""
+        assert verify_token(create_refresh_token(1), token_type="access") is None
+
+    def test_expired_token_rejected(self):
+        """Tokens past their expiry do not verify."""
+        token = create_access_token(1, expires_delta=timedelta(seconds=-10))
+
+        assert verify_token(token) is None
+
+    def test_tampered_token_rejected(self):
+        """A modified signature fails verification."""
+        token = create_access_token(1)
+        tampered = token[:-2] + ("AA" if not token.endswith("AA") else "BB")
+
+        assert verify_token(tampered) is None
+
+    @pytest.mark.parametrize("claims", [
+        {"sub": "not-a-number", "exp": 2_000_000_000, "type": "access"},
+        {"exp": 2_000_000_000, "type": "access"},
+        {"sub": "5", "type": "access"},
+    ])
+    def test_malformed_claims_rejected(self, claims):
+        """Tokens with a missing or non-numeric subject or no expiry do not verify."""
+        assert verify_token(_encode_token(claims)) is None
+
+
+class TestTokenCache:
+    """Tests for the verified-token cache."""
+
+    def test_repeat_verification_hits_cache(self, monkeypatch):
+        """A second verification of the same token skips decoding."""
+        token = create_access_token(3)
+        first = verify_token(token)
+
+        def fail_decode(*args, **kwargs):
+            raise AssertionError("token should have been served from cache")
+
+        monkeypatch.setattr("app.core.security.jwt.decode", fail_decode)
+
+        assert verify_token(token) is first
+
+    def test_cache_is_per_token_type(self):
+        """A cached access token is not accepted as a refresh token."""
+        token = create_access_token(3)
+
+        assert verify_token(token) is not None
+        assert verify_token(token, token_type="refresh") is None
+
+    def test_cache_entry_expires_with_token(self, monkeypatch):
+        """Cached entries are not served past the token's own expiry."""
+        token = create_access_token(3, expires_delta=timedelta(seconds=5))
+        assert verify_token(token) is not None
+
+        real_time = time.time
+        monkeypatch.setattr("app.core.security.time.time", lambda: real_time() + 30)
+        monkeypatch.setattr("app.core.security.jwt.decode", _raise_expired)
+
+        assert verify_token(token) is None
+
+    def test_key_rotation_invalidates_cache(self, monkeypatch):
+        """Tokens verified under the old secret are rejected after rotation."""
+        token = create_access_token(3)
+        assert verify_token(token) is not None
+
+        monkeypatch.setattr(settings, "JWT_SECRET_KEY", "rotated-secret-key-for-tests-0123456789")
+
+        assert verify_token(token) is None
+
+    def test_algorithm_change_invalidates_cache(self, monkeypatch):
+        """A cached HS256 verification is not served once HS512 is required."""
+        token = create_access_token(3)
+        assert verify_token(token) is not None
+
+        monkeypatch.setattr(settings, "JWT_ALGORITHM", "HS512")
+
+        assert verify_token(token) is None
+
+
+def _raise_expired(*args, **kwargs):
+    """Stand-in for jwt.decode that rejects every token as expired."""
+    raise jwt.ExpiredSignatureError("Signature has expired")
+
+
+class TestValidatePasswordStrength:
+    """Tests for validate_password_strength."""
+
+    def test_valid_password(self):
+        """A long mixed-case password with a digit passes."""
+        assert validate_password_strength("Secret123") == (True, "")
+
+    @pytest.mark.parametrize("password,message", [
+        ("Sec1", "at least 8 characters"),
+        ("secret123", "uppercase"),
+        ("SECRET123", "lowercase"),
+        ("SecretPass", "number"),
+        ("!!!!!!!!", "uppercase"),
+    ])
+    def test_invalid_passwords(self, password, message):
+        """Each missing requirement reports its own message, in order."""
+        is_valid, error = validate_password_strength(password)
+
+        assert not is_valid
+        assert message in error
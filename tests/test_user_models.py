@@ -0,0 +1,82 @@
+"""
+Tests for user and subscription models.
+
+Tests cover:
+- Building User/Subscription when only their own module is imported
+- Lazy re-exports from the app.models package
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def run_isolated(code: str) -> subprocess.CompletedProcess:
+    """Run code in a fresh interpreter so no other model module is preloaded."""
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+
+class TestModelImportIndependence:
+    """Relationship targets must resolve without importing the whole package."""
+
+    def test_user_from_user_module_only(self):
+        """Test User can be built after importing only app.models.user."""
+        result = run_isolated(
+            "from app.models.user import User\n"
+            "user = User(email='a@example.com', hashed_password='x', full_name='A')\n"
+            "print(user.email)\n"
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "a@example.com"
+
+    def test_subscription_from_subscription_module_only(self):
+        """Test Subscription can be built after importing only app.models.subscription."""
+        result = run_isolated(
+            "from app.models.subscription import Subscription\n"
+            "subscription = Subscription(user_id=1)\n"
+            "print(subscription.plan.value)\n"
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "free"
+
+
+class TestLazyPackageExports:
+    """app.models resolves re-exported names on first access."""
+
+    def test_parcel_import_does_not_load_user_models(self):
+        """Test importing app.models.parcel leaves the user models unloaded."""
+        result = run_isolated(
+            "import sys\n"
+            "import app.models.parcel\n"
+            "print('app.models.user' in sys.modules)\n"
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "False"
+
+    def test_reexports_resolve(self):
+        """Test every name in __all__ resolves to the submodule's object."""
+        import app.models as models
+        from app.models.user import User
+
+        assert models.User is User
+        for name in models.__all__:
+            assert getattr(models, name) is not None
+
+    def test_unknown_name_raises(self):
+        """Test unknown attributes raise AttributeError."""
+        import app.models as models
+
+        with pytest.raises(AttributeError):
+            models.NotAModel